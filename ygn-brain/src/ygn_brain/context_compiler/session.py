@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import secrets
 import time
 import uuid
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
@@ -30,9 +32,10 @@ class EventLog:
     def append(
         self, kind: str, data: dict[str, Any], token_estimate: int = 0
     ) -> SessionEvent:
+        now = time.time()
         event = SessionEvent(
-            event_id=f"{int(time.time() * 1000):012x}-{uuid.uuid4().hex[:12]}",
-            timestamp=time.time(),
+            event_id=f"{int(now * 1000):012x}-{secrets.token_hex(6)}",
+            timestamp=now,
             kind=kind,
             data=data,
             token_estimate=token_estimate,
@@ -40,6 +43,23 @@ class EventLog:
         self.events.append(event)
         return event
 
+    def extend(self, records: Iterable[tuple[str, dict[str, Any], int]]) -> list[SessionEvent]:
+        """Append several ``(kind, data, token_estimate)`` events stamped with one time."""
+        now = time.time()
+        prefix = f"{int(now * 1000):012x}-"
+        new_events = [
+            SessionEvent(
+                event_id=prefix + secrets.token_hex(6),
+                timestamp=now,
+                kind=kind,
+                data=data,
+                token_estimate=token_estimate,
+            )
+            for kind, data, token_estimate in records
+        ]
+        self.events.extend(new_events)
+        return new_events
+
     def filter(self, kinds: list[str]) -> list[SessionEvent]:
         return [e for e in self.events if e.kind in kinds]
 
@@ -80,5 +100,18 @@ class Session:
         self.evidence.add(kind, evidence_kind, data)
         return event
 
+    def record_many(
+        self, records: Iterable[tuple[str, dict[str, Any], int]]
+    ) -> list[SessionEvent]:
+        """Record several ``(kind, data, token_estimate)`` events in one call.
+
+        Equivalent to calling :meth:`record` for each item in order.
+        """
+        events = self.event_log.extend(records)
+        self.evidence.extend(
+            (e.kind, _KIND_TO_EVIDENCE.get(e.kind, "output"), e.data) for e in events
+        )
+        return events
+
     def to_evidence_pack(self) -> EvidencePack:
         return self.evidence
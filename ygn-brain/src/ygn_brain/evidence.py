@@ -9,6 +9,7 @@ from __future__ import annotations
 import hashlib
 import json
 import time
+from collections.abc import Iterable
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
@@ -112,6 +113,31 @@ class EvidencePack(BaseModel):
         self.end_time = now
         self.entries.append(entry)
 
+    def extend(self, items: Iterable[tuple[str, str, dict[str, Any] | None]]) -> None:
+        """Append several ``(phase, kind, data)`` entries in one call.
+
+        Equivalent to calling :meth:`add` for each item in order: every entry
+        is still chained to its predecessor's hash.  Kinds are validated
+        before anything is appended, so an invalid item leaves the pack
+        unchanged.
+        """
+        staged = [(phase, EvidenceKind(kind), data) for phase, kind, data in items]
+        if not staged:
+            return
+        prev_hash = self.entries[-1].entry_hash if self.entries else ""
+        new_entries: list[EvidenceEntry] = []
+        for phase, kind, data in staged:
+            entry = EvidenceEntry(phase=phase, kind=kind, data=data or {}, prev_hash=prev_hash)
+            entry.entry_hash = _compute_entry_hash(
+                entry.timestamp, entry.phase, entry.kind.value, entry.data, entry.prev_hash
+            )
+            prev_hash = entry.entry_hash
+            new_entries.append(entry)
+        if self.start_time == 0.0:
+            self.start_time = new_entries[0].timestamp
+        self.end_time = new_entries[-1].timestamp
+        self.entries.extend(new_entries)
+
     def sign(self, private_key_hex: str) -> None:
         """Sign all entries with ed25519. Sets signer_public_key."""
         from nacl.signing import SigningKey  # noqa: S404
@@ -5,8 +5,11 @@ v0.3.0: GuardBackend ABC, scoring, ToolInvocationGuard.
 
 from __future__ import annotations
 
+import hashlib
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import StrEnum
 
@@ -85,39 +88,71 @@ class RegexGuard(GuardBackend):
 
     def check(self, text: str) -> GuardResult:
         """Run all pattern checks and return the highest-severity match."""
-        for pat in _INSTRUCTION_OVERRIDE_PATTERNS:
-            if pat.search(text):
-                return GuardResult(
-                    allowed=False,
-                    threat_level=ThreatLevel.HIGH,
-                    reason=f"Instruction override detected: {pat.pattern}",
-                    score=_THREAT_SCORES[ThreatLevel.HIGH],
-                )
-
-        for pat in _ROLE_MANIPULATION_PATTERNS:
-            if pat.search(text):
-                return GuardResult(
-                    allowed=False,
-                    threat_level=ThreatLevel.HIGH,
-                    reason=f"Role manipulation detected: {pat.pattern}",
-                    score=_THREAT_SCORES[ThreatLevel.HIGH],
-                )
-
-        for pat in _DELIMITER_INJECTION_PATTERNS:
-            if pat.search(text):
-                return GuardResult(
-                    allowed=False,
-                    threat_level=ThreatLevel.CRITICAL,
-                    reason=f"Delimiter injection detected: {pat.pattern}",
-                    score=_THREAT_SCORES[ThreatLevel.CRITICAL],
-                )
+        key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=32).digest()
+        with _regex_cache_lock:
+            cached = _regex_cache.get(key)
+            if cached is not None:
+                _regex_cache.move_to_end(key)
+                return cached
+        result = _regex_check(text)
+        with _regex_cache_lock:
+            _regex_cache[key] = result
+            if len(_regex_cache) > _REGEX_CACHE_SIZE:
+                _regex_cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all memoized verdicts."""
+        with _regex_cache_lock:
+            _regex_cache.clear()
+
+
+_REGEX_CACHE_SIZE = 256
+
+# The regex check is a pure function of *text* and GuardResult is frozen, so
+# verdicts are memoized: repeated inputs (notably the static Red/Blue attack
+# templates) skip the pattern scan entirely.  The cache is keyed by a BLAKE2b
+# digest of the input and holds only verdicts, so raw user text (which may
+# carry secrets or PII) is not retained after the check returns.
+_regex_cache: OrderedDict[bytes, GuardResult] = OrderedDict()
+_regex_cache_lock = threading.Lock()
+
+
+def _regex_check(text: str) -> GuardResult:
+    for pat in _INSTRUCTION_OVERRIDE_PATTERNS:
+        if pat.search(text):
+            return GuardResult(
+                allowed=False,
+                threat_level=ThreatLevel.HIGH,
+                reason=f"Instruction override detected: {pat.pattern}",
+                score=_THREAT_SCORES[ThreatLevel.HIGH],
+            )
 
-        return GuardResult(
-            allowed=True,
-            threat_level=ThreatLevel.NONE,
-            reason="Input passed all checks",
-            score=0.0,
-        )
+    for pat in _ROLE_MANIPULATION_PATTERNS:
+        if pat.search(text):
+            return GuardResult(
+                allowed=False,
+                threat_level=ThreatLevel.HIGH,
+                reason=f"Role manipulation detected: {pat.pattern}",
+                score=_THREAT_SCORES[ThreatLevel.HIGH],
+            )
+
+    for pat in _DELIMITER_INJECTION_PATTERNS:
+        if pat.search(text):
+            return GuardResult(
+                allowed=False,
+                threat_level=ThreatLevel.CRITICAL,
+                reason=f"Delimiter injection detected: {pat.pattern}",
+                score=_THREAT_SCORES[ThreatLevel.CRITICAL],
+            )
+
+    return GuardResult(
+        allowed=True,
+        threat_level=ThreatLevel.NONE,
+        reason="Input passed all checks",
+        score=0.0,
+    )
 
 
 # Backward compatibility alias
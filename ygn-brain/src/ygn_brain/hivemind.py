@@ -10,9 +10,10 @@ from typing import TYPE_CHECKING, Any
 
 from .evidence import EvidencePack
 from .fsm import FSMState, Phase
+from .provider import ChatMessage, ChatRequest, ChatResponse, ChatRole, TokenUsage
 
 if TYPE_CHECKING:
-    from .provider import ChatResponse, LLMProvider
+    from .provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
@@ -177,9 +178,6 @@ class HiveMindPipeline:
 
         async def _guarded(coro: Any, phase_name: str) -> ChatResponse:
             """Wrap an LLM coroutine with optional timeout + fallback."""
-            from .provider import ChatResponse as ChatResp
-            from .provider import TokenUsage
-
             try:
                 if phase_timeout is not None:
                     return await asyncio.wait_for(coro, timeout=phase_timeout)
@@ -191,7 +189,7 @@ class HiveMindPipeline:
                     "error",
                     {"error": "timeout", "timeout_sec": phase_timeout},
                 )
-                return ChatResp(
+                return ChatResponse(
                     content=f"[Phase {phase_name} timed out after {phase_timeout}s]",
                     tool_calls=[],
                     usage=TokenUsage(prompt_tokens=0, completion_tokens=0),
@@ -272,8 +270,6 @@ class HiveMindPipeline:
     async def _llm_determine_strategy(
         provider: LLMProvider, model: str, user_input: str
     ) -> ChatResponse:
-        from .provider import ChatMessage, ChatRequest, ChatRole
-
         return await provider.chat(
             ChatRequest(
                 model=model,
@@ -292,8 +288,6 @@ class HiveMindPipeline:
     async def _llm_create_plan(
         provider: LLMProvider, model: str, user_input: str, strategy: str
     ) -> ChatResponse:
-        from .provider import ChatMessage, ChatRequest, ChatRole
-
         return await provider.chat(
             ChatRequest(
                 model=model,
@@ -311,8 +305,6 @@ class HiveMindPipeline:
     async def _llm_execute(
         provider: LLMProvider, model: str, user_input: str, plan: str
     ) -> ChatResponse:
-        from .provider import ChatMessage, ChatRequest, ChatRole
-
         return await provider.chat(
             ChatRequest(
                 model=model,
@@ -330,8 +322,6 @@ class HiveMindPipeline:
     async def _llm_synthesize(
         provider: LLMProvider, model: str, user_input: str, exec_output: str
     ) -> ChatResponse:
-        from .provider import ChatMessage, ChatRequest, ChatRole
-
         return await provider.chat(
             ChatRequest(
                 model=model,
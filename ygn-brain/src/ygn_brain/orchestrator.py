@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import uuid
 from typing import TYPE_CHECKING, Any
 
@@ -38,6 +39,15 @@ class Orchestrator:
         self._provider = provider if provider is not None else ProviderFactory.create()
         self._provider_router = provider_router
 
+    def reset(self) -> None:
+        """Start a fresh session, keeping guard, memory and provider wiring.
+
+        Cheaper than constructing a new :class:`Orchestrator` between
+        conversations.
+        """
+        self.state = FSMState()
+        self.evidence = EvidencePack(session_id=uuid.uuid4().hex[:12])
+
     def run(self, user_input: str) -> dict[str, Any]:
         """Execute a full pipeline pass.
 
@@ -165,6 +175,27 @@ class Orchestrator:
             "session_id": self.evidence.session_id,
         }
 
+    async def run_many(
+        self, user_inputs: list[str], max_concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Run :meth:`run_async` for several inputs concurrently.
+
+        At most *max_concurrency* passes are in flight at once, so a large
+        batch does not start every provider call together.  Results are
+        returned in input order.  Afterwards ``state`` and ``evidence``
+        reflect whichever pass finished last.
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(text: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.run_async(text)
+
+        return list(await asyncio.gather(*(bounded(text) for text in user_inputs)))
+
     def run_compiled(
         self,
         user_input: str,
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
 from .provider import LLMProvider
 from .swarm import TaskComplexity
 
@@ -23,6 +26,46 @@ _PREFIX_MAP: dict[str, str] = {
 }
 
 
+@dataclass(slots=True)
+class _PrefixNode:
+    """Character trie node over ``_PREFIX_MAP`` prefixes."""
+
+    children: dict[str, _PrefixNode] = field(default_factory=dict)
+    provider: str | None = None  # set when a prefix ends at this node
+
+
+def _build_prefix_trie(prefixes: dict[str, str]) -> _PrefixNode:
+    root = _PrefixNode()
+    for prefix, provider_name in prefixes.items():
+        node = root
+        for char in prefix:
+            node = node.children.setdefault(char, _PrefixNode())
+        node.provider = provider_name
+    return root
+
+
+_PREFIX_TRIE = _build_prefix_trie(_PREFIX_MAP)
+
+# Model names whose route() result is memoized per router (least recently
+# used are evicted first).
+_ROUTE_CACHE_SIZE = 256
+
+
+def _prefix_providers(model_name: str) -> list[str]:
+    """Return providers whose prefix matches *model_name*, longest prefix first."""
+    matches: list[str] = []
+    node = _PREFIX_TRIE
+    for char in model_name:
+        child = node.children.get(char)
+        if child is None:
+            break
+        node = child
+        if node.provider is not None:
+            matches.append(node.provider)
+    matches.reverse()
+    return matches
+
+
 class ProviderRouter:
     """Routes model names to providers and manages provider lifecycle."""
 
@@ -30,12 +73,16 @@ class ProviderRouter:
         self._providers: dict[str, LLMProvider] = {}
         self._model_map: dict[str, str] = {}  # model_name -> provider_name
         self._default: str | None = None
+        # Memoized route() results, bounded by _ROUTE_CACHE_SIZE; cleared
+        # whenever the routing inputs change.
+        self._resolved: OrderedDict[str, LLMProvider] = OrderedDict()
 
     # -- registration -------------------------------------------------------
 
     def register(self, provider: LLMProvider) -> None:
         """Register a provider under its canonical name."""
         self._providers[provider.name()] = provider
+        self._resolved.clear()
 
     def set_default(self, provider_name: str) -> None:
         """Set the default provider used when no mapping matches."""
@@ -43,6 +90,7 @@ class ProviderRouter:
             msg = f"Unknown provider: {provider_name}"
             raise KeyError(msg)
         self._default = provider_name
+        self._resolved.clear()
 
     def map_model(self, model_name: str, provider_name: str) -> None:
         """Explicitly map a model name to a registered provider."""
@@ -50,6 +98,7 @@ class ProviderRouter:
             msg = f"Unknown provider: {provider_name}"
             raise KeyError(msg)
         self._model_map[model_name] = provider_name
+        self._resolved.clear()
 
     # -- lookup -------------------------------------------------------------
 
@@ -61,17 +110,31 @@ class ProviderRouter:
         2. Prefix match via ``_PREFIX_MAP``.
         3. Default provider (if set).
         4. Raise ``KeyError``.
+
+        Successful resolutions are memoized for the most recently routed
+        model names.
         """
+        resolved = self._resolved
+        cached = resolved.get(model_name)
+        if cached is not None:
+            resolved.move_to_end(model_name)
+            return cached
+        provider = self._resolve(model_name)
+        resolved[model_name] = provider
+        if len(resolved) > _ROUTE_CACHE_SIZE:
+            resolved.popitem(last=False)
+        return provider
+
+    def _resolve(self, model_name: str) -> LLMProvider:
+        """Uncached resolution used by :meth:`route`."""
         # 1. Explicit mapping
         if model_name in self._model_map:
             return self._providers[self._model_map[model_name]]
 
-        # 2. Prefix heuristic
-        lower = model_name.lower()
-        for prefix, provider_name in _PREFIX_MAP.items():
-            if lower.startswith(prefix):
-                if provider_name in self._providers:
-                    return self._providers[provider_name]
+        # 2. Prefix heuristic (longest registered prefix wins)
+        for provider_name in _prefix_providers(model_name.lower()):
+            if provider_name in self._providers:
+                return self._providers[provider_name]
 
         # 3. Default
         if self._default is not None:
@@ -118,6 +181,19 @@ _COMPLEXITY_MODELS: dict[TaskComplexity, str] = {
     TaskComplexity.EXPERT: "gpt-5.2-codex",
 }
 
+# Flat (provider, complexity) -> model table used when a provider is preferred.
+_PROVIDER_MODELS: dict[tuple[str, TaskComplexity], str] = {
+    **{("codex", c): "gpt-5.2-codex" for c in TaskComplexity},
+    **{("gemini", c): "gemini-3.1-pro-preview" for c in TaskComplexity},
+    **{("ollama", c): "llama3" for c in TaskComplexity},
+    **{
+        ("openai", c): (
+            "gpt-4o" if c in {TaskComplexity.EXPERT, TaskComplexity.COMPLEX} else "gpt-4o-mini"
+        )
+        for c in TaskComplexity
+    },
+}
+
 
 class ModelSelector:
     """Selects the best model/provider for a given task based on complexity and requirements."""
@@ -154,15 +230,8 @@ class ModelSelector:
         requires_vision: bool,  # noqa: ARG004
     ) -> str:
         """Pick a model name given a provider and complexity."""
-        if provider == "codex":
-            return "gpt-5.2-codex"
-        if provider == "openai":
-            if complexity in {TaskComplexity.EXPERT, TaskComplexity.COMPLEX}:
-                return "gpt-4o"
-            return "gpt-4o-mini"
-        if provider == "gemini":
-            return "gemini-3.1-pro-preview"
-        if provider == "ollama":
-            return "llama3"
+        model = _PROVIDER_MODELS.get((provider, complexity))
+        if model is not None:
+            return model
         # Default: use the complexity map (codex-based)
         return _COMPLEXITY_MODELS.get(complexity, "gpt-5.2-codex")
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from collections.abc import Iterable
 from typing import Any
 
 from .orchestrator import Orchestrator
 from .provider_factory import ProviderFactory
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     """Entry point for ``ygn-brain-repl`` command (synchronous).
 
     Uses :class:`ProviderFactory` to select the provider based on
     ``YGN_LLM_PROVIDER`` env var.  Sync mode always uses stub because
-    the CLI providers require async I/O.
+    the CLI providers require async I/O; pass ``--async`` to run
+    :func:`async_main` instead.
     """
+    args = sys.argv[1:] if argv is None else argv
+    if "--async" in args:
+        run_async_main()
+        return
+
     print("Y-GN Brain REPL v0.1.0")
     print("Type 'quit' or 'exit' to exit, 'status' for pipeline info")
     print("Using StubLLMProvider (sync mode — use --async for CLI providers)")
@@ -24,38 +31,22 @@ def main() -> None:
 
     orchestrator = Orchestrator()
 
-    while True:
-        try:
-            user_input = input("ygn> ")
-        except (EOFError, KeyboardInterrupt):
-            print("\nBye!")
-            break
-
-        stripped = user_input.strip()
-        if not stripped:
-            continue
-        if stripped in ("quit", "exit"):
-            print("Bye!")
-            break
-        if stripped == "status":
-            print(f"  FSM state: {orchestrator.state.phase}")
-            print(f"  Session: {orchestrator.evidence.session_id}")
-            print(f"  Evidence entries: {len(orchestrator.evidence.entries)}")
-            continue
-        if stripped == "help":
-            print("Commands: status, help, quit/exit")
-            print("Anything else is processed as a task through the pipeline")
+    while (stripped := _next_command()) is not None:
+        if not stripped or _handle_builtin(stripped, orchestrator, "pipeline"):
             continue
-
         # Run through orchestrator (sync uses stub pipeline)
         result = orchestrator.run(stripped)
         _print_result(result)
 
 
-async def async_main() -> None:
+async def async_main(lines: Iterable[str] | None = None) -> None:
     """Async entry point — uses the provider resolved by ProviderFactory.
 
     Set ``YGN_LLM_PROVIDER`` to ``codex``, ``gemini``, or ``stub``.
+
+    When *lines* is given (e.g. piped stdin) the REPL runs in batch mode:
+    consecutive tasks are executed concurrently via
+    :meth:`Orchestrator.run_many` and printed in input order.
     """
     provider = ProviderFactory.create()
     desc = ProviderFactory.describe(provider)
@@ -67,31 +58,74 @@ async def async_main() -> None:
 
     orchestrator = Orchestrator(provider=provider)
 
-    while True:
-        try:
-            user_input = input("ygn> ")
-        except (EOFError, KeyboardInterrupt):
-            print("\nBye!")
-            break
+    if lines is not None:
+        await _run_batch(orchestrator, lines)
+        return
 
-        stripped = user_input.strip()
-        if not stripped:
+    while (stripped := _next_command()) is not None:
+        if not stripped or _handle_builtin(stripped, orchestrator, "pipeline (async)"):
             continue
+        result = await orchestrator.run_async(stripped)
+        _print_result(result)
+
+
+async def _run_batch(orchestrator: Orchestrator, lines: Iterable[str]) -> None:
+    """Process pre-read input lines, batching runs of consecutive tasks."""
+    pending: list[str] = []
+
+    async def flush() -> None:
+        for result in await orchestrator.run_many(pending):
+            _print_result(result)
+        pending.clear()
+
+    for line in lines:
+        stripped = line.strip()
         if stripped in ("quit", "exit"):
-            print("Bye!")
             break
-        if stripped == "status":
-            print(f"  FSM state: {orchestrator.state.phase}")
-            print(f"  Session: {orchestrator.evidence.session_id}")
-            print(f"  Evidence entries: {len(orchestrator.evidence.entries)}")
-            continue
-        if stripped == "help":
-            print("Commands: status, help, quit/exit")
-            print("Anything else is processed as a task through the pipeline (async)")
+        if not stripped:
             continue
-
-        result = await orchestrator.run_async(stripped)
-        _print_result(result)
+        if stripped in _BUILTIN_COMMANDS:
+            await flush()
+            _handle_builtin(stripped, orchestrator, "pipeline (async)")
+        else:
+            pending.append(stripped)
+    await flush()
+    print("Bye!")
+
+
+def _next_command() -> str | None:
+    """Read and strip one input line; ``None`` means the session should end."""
+    try:
+        user_input = input("ygn> ")
+    except (EOFError, KeyboardInterrupt):
+        print("\nBye!")
+        return None
+    stripped = user_input.strip()
+    if stripped in ("quit", "exit"):
+        print("Bye!")
+        return None
+    return stripped
+
+
+_BUILTIN_COMMANDS = frozenset({"status", "reset", "help"})
+
+
+def _handle_builtin(command: str, orchestrator: Orchestrator, pipeline: str) -> bool:
+    """Run a built-in REPL command; return ``False`` if *command* is a task."""
+    if command == "status":
+        print(f"  FSM state: {orchestrator.state.phase}")
+        print(f"  Session: {orchestrator.evidence.session_id}")
+        print(f"  Evidence entries: {len(orchestrator.evidence.entries)}")
+        return True
+    if command == "reset":
+        orchestrator.reset()
+        print(f"  New session: {orchestrator.evidence.session_id}")
+        return True
+    if command == "help":
+        print("Commands: status, reset, help, quit/exit")
+        print(f"Anything else is processed as a task through the {pipeline}")
+        return True
+    return False
 
 
 def _print_result(result: dict[str, Any]) -> None:
@@ -102,12 +136,13 @@ def _print_result(result: dict[str, Any]) -> None:
 
 
 def run_async_main() -> None:
-    """Sync wrapper that launches :func:`async_main` via ``asyncio.run``."""
-    asyncio.run(async_main())
+    """Sync wrapper that launches :func:`async_main` via ``asyncio.run``.
+
+    Piped (non-TTY) stdin is read up front and processed in batch mode.
+    """
+    lines = None if sys.stdin.isatty() else sys.stdin.readlines()
+    asyncio.run(async_main(lines))
 
 
 if __name__ == "__main__":
-    if "--async" in sys.argv:
-        run_async_main()
-    else:
-        main()
+    main()
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
+import heapq
+import secrets
+import threading
 import time
-import uuid
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any
 
+from .swarm import SwarmMode, TaskComplexity
 
-@dataclass
+# Stable small-integer id per swarm mode, used by the columnar mode array.
+# Each SuccessMemory extends a copy with any non-member mode strings it sees.
+_MODES: tuple[SwarmMode, ...] = tuple(SwarmMode)
+_MODE_IDS: dict[str, int] = {mode: i for i, mode in enumerate(_MODES)}
+
+
+def _as_member(enum_cls: type[StrEnum], value: str) -> str:
+    """Return the *enum_cls* member for *value*, or *value* itself if none."""
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return value
+
+
+@dataclass(slots=True)
 class SuccessRecord:
     """A single recorded task outcome."""
 
-    record_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    record_id: str = field(default_factory=lambda: secrets.token_hex(16))
     task_description: str = ""
-    swarm_mode: str = ""
+    swarm_mode: SwarmMode | str = SwarmMode.SEQUENTIAL
     domains: list[str] = field(default_factory=list)
-    complexity: str = ""
+    complexity: TaskComplexity | str = TaskComplexity.MODERATE
     outcome: str = ""  # "success" or "failure"
     confidence: float = 0.0
     timestamp: float = field(default_factory=time.time)
@@ -28,28 +49,87 @@ class SuccessMemory:
 
     def __init__(self) -> None:
         self._records: list[SuccessRecord] = []
+        # Columnar copies of the fields scanned by query()/best_mode_for().
+        self._mode_col: array[int] = array("H")
+        self._success_col: array[int] = array("B")
+        self._confidence_col: array[float] = array("d")
+        # Decodes the ids stored in ``_mode_col``.
+        self._modes: list[SwarmMode | str] = list(_MODES)
+        self._mode_ids: dict[str, int] = dict(_MODE_IDS)
+        # Secondary indexes (positions into ``_records``) and running
+        # per-mode aggregates, maintained incrementally by ``record()``.
+        self._by_domain: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_complexity: defaultdict[str, list[int]] = defaultdict(list)
+        self._mode_stats: defaultdict[str, list[int]] = defaultdict(
+            lambda: [0, 0]
+        )  # mode -> [successes, total]
+        # Serialises writers; readers stay lock-free because record() fills the
+        # columns before publishing a position via ``_records`` and the indexes.
+        self._write_lock = threading.Lock()
 
     def record(
         self,
         task_desc: str,
-        mode: str,
+        mode: SwarmMode | str,
         domains: list[str],
-        complexity: str,
+        complexity: TaskComplexity | str,
         outcome: str,
         confidence: float,
     ) -> SuccessRecord:
-        """Record a task outcome and return the created record."""
+        """Record a task outcome and return the created record.
+
+        *mode* and *complexity* are stored as their enum members when they
+        name one; any other string is stored as given.
+        """
+        swarm_mode = _as_member(SwarmMode, mode)
+        task_complexity = _as_member(TaskComplexity, complexity)
         rec = SuccessRecord(
             task_description=task_desc,
-            swarm_mode=mode,
+            swarm_mode=swarm_mode,
             domains=list(domains),
-            complexity=complexity,
+            complexity=task_complexity,
             outcome=outcome,
             confidence=confidence,
         )
-        self._records.append(rec)
+        with self._write_lock:
+            pos = len(self._records)
+            mode_id = self._mode_ids.get(swarm_mode)
+            if mode_id is None:
+                mode_id = self._mode_ids[swarm_mode] = len(self._modes)
+                self._modes.append(swarm_mode)
+            self._mode_col.append(mode_id)
+            self._success_col.append(outcome == "success")
+            self._confidence_col.append(confidence)
+            self._records.append(rec)
+            for domain in set(rec.domains):
+                self._by_domain[domain].append(pos)
+            self._by_complexity[task_complexity].append(pos)
+            stats = self._mode_stats[swarm_mode]
+            stats[1] += 1
+            if outcome == "success":
+                stats[0] += 1
         return rec
 
+    def _iter_matching(
+        self,
+        domains: list[str] | None,
+        complexity: str | None,
+    ) -> Iterable[int]:
+        """Return positions of records matching the filters, in no particular order."""
+        if domains is None:
+            if complexity is None:
+                return range(len(self._records))
+            return self._by_complexity.get(complexity, ())
+        if len(domains) == 1 and complexity is None:
+            # Common single-domain lookup: the bucket already is the answer.
+            return self._by_domain.get(domains[0], ())
+        positions: set[int] = set()
+        for domain in domains:
+            positions.update(self._by_domain.get(domain, ()))
+        if complexity is not None:
+            positions.intersection_update(self._by_complexity.get(complexity, ()))
+        return positions
+
     def query(
         self,
         domains: list[str] | None = None,
@@ -57,61 +137,61 @@ class SuccessMemory:
         limit: int = 10,
     ) -> list[SuccessRecord]:
         """Return matching records sorted by confidence descending."""
-        results: list[SuccessRecord] = []
-        for rec in self._records:
-            if domains is not None:
-                domain_set = set(domains)
-                if not domain_set.intersection(rec.domains):
-                    continue
-            if complexity is not None and rec.complexity != complexity:
-                continue
-            results.append(rec)
-        results.sort(key=lambda r: r.confidence, reverse=True)
-        return results[:limit]
-
-    def best_mode_for(self, domains: list[str], complexity: str) -> str | None:
+        positions = sorted(self._iter_matching(domains, complexity))
+        top = heapq.nlargest(limit, positions, key=self._confidence_col.__getitem__)
+        return [self._records[pos] for pos in top]
+
+    def best_mode_for(self, domains: list[str], complexity: str) -> SwarmMode | str | None:
         """Return the swarm mode with the highest success rate for similar tasks.
 
         Only considers records matching at least one of the given domains *and*
         the specified complexity.  Returns ``None`` if no matching records exist.
         """
-        matching = self.query(domains=domains, complexity=complexity, limit=999)
-        if not matching:
+        # Single pass: per mode id successes and totals, read from the columns.
+        # ``first`` ranks each mode by its best record (highest confidence,
+        # then earliest) -- the order in which a confidence-sorted scan meets
+        # the modes -- so equal rates resolve to the mode seen first.
+        # Keyed by mode id: a concurrent record() may add ids mid-scan.
+        successes: dict[int, int] = {}
+        totals: dict[int, int] = {}
+        first: dict[int, tuple[float, int]] = {}
+        mode_col = self._mode_col
+        success_col = self._success_col
+        confidence_col = self._confidence_col
+        for pos in self._iter_matching(domains, complexity):
+            mode_id = mode_col[pos]
+            rank = (-confidence_col[pos], pos)
+            if mode_id not in totals:
+                totals[mode_id] = successes[mode_id] = 0
+                first[mode_id] = rank
+            elif rank < first[mode_id]:
+                first[mode_id] = rank
+            totals[mode_id] += 1
+            successes[mode_id] += success_col[pos]
+
+        if not totals:
             return None
-
-        # Group by mode, compute success rate
-        mode_stats: dict[str, tuple[int, int]] = {}  # mode -> (successes, total)
-        for rec in matching:
-            successes, total = mode_stats.get(rec.swarm_mode, (0, 0))
-            total += 1
-            if rec.outcome == "success":
-                successes += 1
-            mode_stats[rec.swarm_mode] = (successes, total)
-
-        best_mode: str | None = None
-        best_rate = -1.0
-        for mode, (successes, total) in mode_stats.items():
-            rate = successes / total if total > 0 else 0.0
-            if rate > best_rate:
-                best_rate = rate
-                best_mode = mode
-        return best_mode
+        best_id = min(totals, key=lambda i: (-successes[i] / totals[i], first[i]))
+        return self._modes[best_id]
 
     def success_rate(self, mode: str) -> float:
         """Return the overall success rate for a given swarm mode."""
-        total = 0
-        successes = 0
-        for rec in self._records:
-            if rec.swarm_mode == mode:
-                total += 1
-                if rec.outcome == "success":
-                    successes += 1
-        if total == 0:
+        stats = self._mode_stats.get(mode)
+        if stats is None or stats[1] == 0:
             return 0.0
-        return successes / total
+        return stats[0] / stats[1]
 
     def clear(self) -> int:
         """Remove all records. Returns the number removed."""
-        count = len(self._records)
-        self._records.clear()
+        with self._write_lock:
+            count = len(self._records)
+            self._records.clear()
+            del self._mode_col[:]
+            del self._success_col[:]
+            del self._confidence_col[:]
+            self._by_domain.clear()
+            self._by_complexity.clear()
+            self._mode_stats.clear()
+            self._modes[len(_MODES) :] = []
+            self._mode_ids = dict(_MODE_IDS)
         return count
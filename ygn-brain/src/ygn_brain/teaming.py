@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
+import secrets
 import time
-import uuid
-from collections.abc import Callable
+from collections import Counter
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import StrEnum
+from types import MappingProxyType
 from typing import Any
 
 from .swarm import SwarmMode, SwarmResult, TaskAnalysis, TaskAnalyzer, TaskComplexity
@@ -16,7 +19,7 @@ from .swarm import SwarmMode, SwarmResult, TaskAnalysis, TaskAnalyzer, TaskCompl
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentProfile:
     """Describes a single agent in the distributed grid."""
 
@@ -28,7 +31,7 @@ class AgentProfile:
     is_local: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamFormation:
     """A formed team of agents ready to execute a task."""
 
@@ -54,21 +57,45 @@ class FlowPolicy(StrEnum):
 class FlowController:
     """Controls conversation flow among agents based on a chosen policy."""
 
-    def __init__(self, policy: FlowPolicy, agents: list[AgentProfile]) -> None:
+    def __init__(self, policy: FlowPolicy, agents: Sequence[AgentProfile]) -> None:
         self._policy = policy
-        self._agents = list(agents)
+        # Immutable snapshot; tuple() returns a tuple argument as-is, so
+        # callers holding a tuple pay no copy.
+        self._agents: tuple[AgentProfile, ...] = tuple(agents)
         self._turn_index: int = 0
+        # DEBATE lookup; built in reverse so a duplicated id maps to its first
+        # occurrence, as the former linear scan did.
+        self._by_id = {agent.agent_id: agent for agent in reversed(self._agents)}
+        # LEAD_FIRST order; the stable sort keeps the first of equally
+        # trusted agents in front, matching max().
+        self._by_trust = sorted(self._agents, key=lambda a: a.trust_level, reverse=True)
+        # CAPABILITY_MATCH state: lowercased capabilities per agent, and the
+        # words of the turns seen so far (the conversation is append-only).
+        # Capabilities keep their occurrence counts, so a duplicated entry
+        # scores once per occurrence, as a scan of ``capabilities`` would.
+        self._agent_caps: list[tuple[AgentProfile, Counter[str]]] = [
+            (agent, Counter(cap.lower() for cap in agent.capabilities)) for agent in self._agents
+        ]
+        self._unresolved_words: set[str] = set()
+        self._seen_conversation: list[dict[str, Any]] | None = None
+        self._seen_turns = 0
+        # The last turn read, and its content, to notice a list that was
+        # cleared and refilled (or whose last turn was replaced or edited).
+        self._seen_last: dict[str, Any] | None = None
+        self._seen_last_content: str = ""
+        # The policy is fixed for the controller's lifetime: resolve its
+        # strategy once instead of re-dispatching on every turn.
+        strategies: dict[FlowPolicy, Callable[[list[dict[str, Any]]], AgentProfile]] = {
+            FlowPolicy.ROUND_ROBIN: self._round_robin,
+            FlowPolicy.LEAD_FIRST: self._lead_first,
+            FlowPolicy.CAPABILITY_MATCH: self._capability_match,
+            FlowPolicy.DEBATE: self._debate,
+        }
+        self._strategy = strategies.get(policy, self._debate)
 
     def next_speaker(self, conversation: list[dict[str, Any]]) -> AgentProfile:
         """Pick the next agent to speak based on the active flow policy."""
-        if self._policy == FlowPolicy.ROUND_ROBIN:
-            return self._round_robin(conversation)
-        if self._policy == FlowPolicy.LEAD_FIRST:
-            return self._lead_first(conversation)
-        if self._policy == FlowPolicy.CAPABILITY_MATCH:
-            return self._capability_match(conversation)
-        # DEBATE
-        return self._debate(conversation)
+        return self._strategy(conversation)
 
     def should_conclude(self, conversation: list[dict[str, Any]], max_rounds: int = 5) -> bool:
         """Decide when to stop the discussion."""
@@ -87,43 +114,55 @@ class FlowController:
     def _lead_first(self, conversation: list[dict[str, Any]]) -> AgentProfile:
         """Lead speaks first, then others respond in trust-level order."""
         if not conversation:
-            # First turn: pick the agent with the highest trust level (the lead)
-            return max(self._agents, key=lambda a: a.trust_level)
-
-        # Subsequent turns: cycle through others sorted by trust level descending
-        non_lead = sorted(
-            self._agents,
-            key=lambda a: a.trust_level,
-            reverse=True,
-        )
-        idx = (len(conversation) - 1) % len(non_lead)
-        return non_lead[idx]
+            # First turn: the agent with the highest trust level (the lead)
+            return self._by_trust[0]
+
+        # Subsequent turns: cycle through agents by trust level descending
+        idx = (len(conversation) - 1) % len(self._by_trust)
+        return self._by_trust[idx]
 
     def _capability_match(self, conversation: list[dict[str, Any]]) -> AgentProfile:
         """Next speaker is the one whose capabilities best match unresolved aspects."""
-        # Collect words from conversation that hint at unresolved topics
-        unresolved_words: set[str] = set()
-        for turn in conversation:
+        # Collect words from conversation that hint at unresolved topics;
+        # only turns appended since the previous call need tokenizing.  Any
+        # other change to the turns already read starts over.
+        seen = self._seen_turns
+        if (
+            conversation is not self._seen_conversation
+            or len(conversation) < seen
+            or (
+                seen
+                and (
+                    conversation[seen - 1] is not self._seen_last
+                    or conversation[seen - 1].get("content", "") != self._seen_last_content
+                )
+            )
+        ):
+            self._unresolved_words = set()
+            self._seen_conversation = conversation
+            seen = 0
+        unresolved_words = self._unresolved_words
+        for turn in conversation[seen:]:
             content: str = turn.get("content", "")
             unresolved_words.update(content.lower().split())
+        self._seen_turns = len(conversation)
+        if conversation:
+            self._seen_last = conversation[-1]
+            self._seen_last_content = conversation[-1].get("content", "")
 
-        def _score(agent: AgentProfile) -> int:
-            return sum(1 for cap in agent.capabilities if cap.lower() in unresolved_words)
+        # max() keeps the first of equally scored agents, like a stable sort.
+        def score(pair: tuple[AgentProfile, Counter[str]]) -> int:
+            return sum(n for cap, n in pair[1].items() if cap in unresolved_words)
 
-        scored = sorted(self._agents, key=_score, reverse=True)
-        return scored[0]
+        return max(self._agent_caps, key=score)[0]
 
     def _debate(self, conversation: list[dict[str, Any]]) -> AgentProfile:
         """Alternate between agents with different roles."""
         if not conversation:
             return self._agents[0]
 
-        last_role = ""
-        last_speaker_id = conversation[-1].get("agent_id", "")
-        for agent in self._agents:
-            if agent.agent_id == last_speaker_id:
-                last_role = agent.role
-                break
+        last_speaker = self._by_id.get(conversation[-1].get("agent_id", ""))
+        last_role = last_speaker.role if last_speaker is not None else ""
 
         # Pick an agent with a different role
         for agent in self._agents:
@@ -142,26 +181,48 @@ class FlowController:
 class TeamBuilder:
     """Forms and dissolves teams from a pool of available agents."""
 
-    def __init__(self, available_agents: list[AgentProfile]) -> None:
-        self._available_agents = list(available_agents)
+    def __init__(self, available_agents: Sequence[AgentProfile]) -> None:
         self._active_teams: dict[str, TeamFormation] = {}
+        self.set_available_agents(available_agents)
 
-    def form_team(self, task_analysis: TaskAnalysis, max_size: int = 4) -> TeamFormation:
-        """Select agents, assign a lead, and choose a strategy."""
-        # Score agents by how many of their capabilities match the task domains
-        scored: list[tuple[AgentProfile, int]] = []
-        for agent in self._available_agents:
-            score = sum(1 for cap in agent.capabilities if cap in task_analysis.domains)
-            scored.append((agent, score))
+    def set_available_agents(self, available_agents: Sequence[AgentProfile]) -> None:
+        """Replace the agent pool and rebuild the capability index."""
+        self._available_agents: tuple[AgentProfile, ...] = tuple(available_agents)
+        self._rebuild_index()
 
-        # Sort by score descending, then by trust level descending
-        scored.sort(key=lambda pair: (pair[1], pair[0].trust_level), reverse=True)
+    def _rebuild_index(self) -> None:
+        """Map each capability to the pool positions of the agents that have it.
 
-        selected = [agent for agent, _ in scored[:max_size]]
+        A position appears once per occurrence of the capability, so index
+        scoring counts exactly what a scan of ``agent.capabilities`` would.
+        """
+        cap_index: dict[str, list[int]] = {}
+        for position, agent in enumerate(self._available_agents):
+            for cap in agent.capabilities:
+                cap_index.setdefault(cap, []).append(position)
+        self._cap_index = cap_index
+
+    def form_team(self, task_analysis: TaskAnalysis, max_size: int = 4) -> TeamFormation:
+        """Select agents, assign a lead, and choose a strategy."""
+        # Score agents by how many of their capabilities match the task
+        # domains, touching only the posting lists of those domains.
+        agents = self._available_agents
+        scores = [0] * len(agents)
+        for domain in frozenset(task_analysis.domains):
+            for position in self._cap_index.get(domain, ()):
+                scores[position] += 1
+
+        # Top max_size by score, then trust level (ties keep pool order)
+        top = heapq.nlargest(
+            max_size,
+            range(len(agents)),
+            key=lambda i: (scores[i], agents[i].trust_level),
+        )
+        selected = [agents[i] for i in top]
 
         # If we got nothing (unlikely), take first available agents
         if not selected:
-            selected = self._available_agents[:max_size]
+            selected = list(self._available_agents[:max_size])
 
         # Lead is the agent with the highest trust level
         lead = max(selected, key=lambda a: a.trust_level)
@@ -170,7 +231,7 @@ class TeamBuilder:
         strategy = self._pick_strategy(task_analysis.complexity).value
 
         team = TeamFormation(
-            team_id=uuid.uuid4().hex[:12],
+            team_id=secrets.token_hex(6),
             agents=selected,
             lead_agent_id=lead.agent_id,
             strategy=strategy,
@@ -206,6 +267,23 @@ class TeamBuilder:
 # ---------------------------------------------------------------------------
 
 
+# Strategy strings (TeamFormation.strategy) are resolved to their SwarmMode
+# through _MODE_BY_VALUE before looking up the policy.
+_STRATEGY_TO_POLICY: Mapping[SwarmMode, FlowPolicy] = MappingProxyType(
+    {
+        SwarmMode.PARALLEL: FlowPolicy.ROUND_ROBIN,
+        SwarmMode.SEQUENTIAL: FlowPolicy.ROUND_ROBIN,
+        SwarmMode.RED_BLUE: FlowPolicy.DEBATE,
+        SwarmMode.PING_PONG: FlowPolicy.DEBATE,
+        SwarmMode.LEAD_SUPPORT: FlowPolicy.LEAD_FIRST,
+        SwarmMode.SPECIALIST: FlowPolicy.CAPABILITY_MATCH,
+    }
+)
+
+# Strategy name -> SwarmMode, so unknown names resolve without an exception.
+_MODE_BY_VALUE: Mapping[str, SwarmMode] = MappingProxyType({mode.value: mode for mode in SwarmMode})
+
+
 class DistributedSwarmEngine:
     """Extends the SwarmEngine concept with team formation and flow control."""
 
@@ -224,7 +302,7 @@ class DistributedSwarmEngine:
         analysis = self._analyzer.analyze(user_input)
 
         # 2. Form a team
-        self._team_builder._available_agents = list(available_agents)  # noqa: SLF001
+        self._team_builder.set_available_agents(available_agents)
         team = self._team_builder.form_team(analysis)
 
         # 3. Choose flow policy based on strategy
@@ -236,14 +314,27 @@ class DistributedSwarmEngine:
         # 5. Simulate multi-agent conversation
         conversation: list[dict[str, Any]] = []
         max_rounds = 5
-        while not controller.should_conclude(conversation, max_rounds):
-            speaker = controller.next_speaker(conversation)
-            turn: dict[str, Any] = {
-                "agent_id": speaker.agent_id,
-                "role": speaker.role,
-                "content": f"[{speaker.role}] Response to: {user_input}",
-            }
-            conversation.append(turn)
+        append = conversation.append
+        next_speaker = controller.next_speaker
+
+        def _take_turn() -> None:
+            speaker = next_speaker(conversation)
+            append(
+                {
+                    "agent_id": speaker.agent_id,
+                    "role": speaker.role,
+                    "content": f"[{speaker.role}] Response to: {user_input}",
+                }
+            )
+
+        if type(controller) is FlowController:
+            # The stock terminator is purely round-based, so the number of
+            # turns is known up front; custom controllers decide per turn.
+            for _ in range(max_rounds * len(team.agents)):
+                _take_turn()
+        else:
+            while not controller.should_conclude(conversation, max_rounds):
+                _take_turn()
 
         # 6. Aggregate and return result
         output_parts = [turn["content"] for turn in conversation]
@@ -262,20 +353,12 @@ class DistributedSwarmEngine:
     @staticmethod
     def _resolve_mode(strategy: str) -> SwarmMode:
         """Safely convert a strategy string to a SwarmMode."""
-        try:
-            return SwarmMode(strategy)
-        except ValueError:
-            return SwarmMode.SEQUENTIAL
+        return _MODE_BY_VALUE.get(strategy, SwarmMode.SEQUENTIAL)
 
     @staticmethod
     def _strategy_to_policy(strategy: str) -> FlowPolicy:
         """Map a SwarmMode strategy name to a FlowPolicy."""
-        mapping: dict[str, FlowPolicy] = {
-            SwarmMode.PARALLEL.value: FlowPolicy.ROUND_ROBIN,
-            SwarmMode.SEQUENTIAL.value: FlowPolicy.ROUND_ROBIN,
-            SwarmMode.RED_BLUE.value: FlowPolicy.DEBATE,
-            SwarmMode.PING_PONG.value: FlowPolicy.DEBATE,
-            SwarmMode.LEAD_SUPPORT.value: FlowPolicy.LEAD_FIRST,
-            SwarmMode.SPECIALIST.value: FlowPolicy.CAPABILITY_MATCH,
-        }
-        return mapping.get(strategy, FlowPolicy.ROUND_ROBIN)
+        mode = _MODE_BY_VALUE.get(strategy)
+        if mode is None:
+            return FlowPolicy.ROUND_ROBIN
+        return _STRATEGY_TO_POLICY.get(mode, FlowPolicy.ROUND_ROBIN)
@@ -6,15 +6,18 @@ Provides distributed tracing with support for stdout, OTLP, and noop exporters.
 from __future__ import annotations
 
 import contextlib
-from collections.abc import Generator
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from opentelemetry import trace
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.trace import NoOpTracer, Span, Tracer
 
+if TYPE_CHECKING:
+    # The SDK is only needed once an exporter is configured; the default
+    # "none" path runs on the API package alone.
+    from opentelemetry.sdk.trace import TracerProvider
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -28,6 +31,28 @@ class TelemetryConfig:
     enabled: bool = True
     exporter: str = "none"  # "stdout" | "otlp" | "none"
     otlp_endpoint: str = "http://localhost:4317"
+    # OTLP batching (BatchSpanProcessor): spans are queued on end and
+    # exported in batches from a background thread.
+    max_queue_size: int = 4096
+    schedule_delay_ms: int = 1000
+    max_export_batch_size: int = 256
+    export_timeout_ms: int = 10000
+    compression: str = "gzip"  # "gzip" | "deflate" | "none"
+
+
+# gRPC channel tuning for the OTLP exporter: keep the connection warm between
+# batches and allow large batch payloads.
+_OTLP_CHANNEL_OPTIONS: tuple[tuple[str, Any], ...] = (
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", 16 * 1024 * 1024),
+)
+
+
+# Shared by every span opened while tracing is disabled: ``nullcontext`` is
+# reusable and reentrant, so the no-op path allocates nothing per span.
+_NOOP_SPAN: AbstractContextManager[Span] = contextlib.nullcontext(trace.INVALID_SPAN)
 
 
 # ---------------------------------------------------------------------------
@@ -57,6 +82,9 @@ class YgnTracer:
             # NoOp path — no provider needed, default NoOpTracer stays.
             return
 
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+
         resource = Resource.create({"service.name": cfg.service_name})
 
         if cfg.exporter == "stdout":
@@ -75,39 +103,61 @@ class YgnTracer:
                 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
                     OTLPSpanExporter,
                 )
-                from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+                from opentelemetry.sdk.trace.export import BatchSpanProcessor
             except ImportError:  # pragma: no cover
                 # If the OTLP exporter package is not installed, fall back to
                 # noop so the application can still start.
                 return
 
-            exporter = OTLPSpanExporter(endpoint=cfg.otlp_endpoint, insecure=True)
+            exporter_kwargs: dict[str, Any] = {
+                "endpoint": cfg.otlp_endpoint,
+                "insecure": True,
+                "compression": _grpc_compression(cfg.compression),
+                "channel_options": _OTLP_CHANNEL_OPTIONS,
+            }
+            try:
+                exporter = OTLPSpanExporter(**exporter_kwargs)
+            except TypeError:  # pragma: no cover
+                # Exporter releases without ``channel_options`` use defaults.
+                del exporter_kwargs["channel_options"]
+                exporter = OTLPSpanExporter(**exporter_kwargs)
+            # Batched so ending a span never blocks the caller on a network
+            # export; the provider flushes the queue at interpreter exit.
             provider = TracerProvider(resource=resource)
-            provider.add_span_processor(SimpleSpanProcessor(exporter))
+            provider.add_span_processor(
+                BatchSpanProcessor(
+                    exporter,
+                    max_queue_size=cfg.max_queue_size,
+                    schedule_delay_millis=cfg.schedule_delay_ms,
+                    max_export_batch_size=cfg.max_export_batch_size,
+                    export_timeout_millis=cfg.export_timeout_ms,
+                )
+            )
             self._provider = provider
             self._tracer = provider.get_tracer(cfg.service_name)
 
     # -- span helpers --------------------------------------------------------
 
-    @contextlib.contextmanager
     def span(
         self,
         name: str,
         attributes: dict[str, str] | None = None,
-    ) -> Generator[Span, None, None]:
+    ) -> AbstractContextManager[Span]:
         """Create a span as a context manager.
 
         Usage::
 
             with tracer.span("my-op", {"key": "val"}) as s:
                 ...
+
+        With tracing disabled (the default) this returns a shared no-op
+        context manager yielding ``INVALID_SPAN``.
         """
-        otel_tracer = self._tracer
-        with otel_tracer.start_as_current_span(name) as s:
-            if attributes:
-                for k, v in attributes.items():
-                    s.set_attribute(k, v)
-            yield s
+        if type(self._tracer) is NoOpTracer:
+            return _NOOP_SPAN
+        # Attributes go in at creation: one bulk copy instead of a locked
+        # set_attribute() call per key, and samplers get to see them.
+        return self._tracer.start_as_current_span(name, attributes=attributes)
 
     def record_event(
         self,
@@ -115,10 +165,25 @@ class YgnTracer:
         attributes: dict[str, str] | None = None,
     ) -> None:
         """Record a named event on the current active span (if any)."""
-        current_span = trace.get_current_span()
-        if current_span.is_recording():
+        if type(self._tracer) is NoOpTracer:
+            return
+        self.record_event_on(trace.get_current_span(), name, attributes)
+
+    @staticmethod
+    def record_event_on(
+        span: Span,
+        name: str,
+        attributes: dict[str, str] | None = None,
+    ) -> None:
+        """Record a named event on *span* directly.
+
+        For callers already holding the span from ``with tracer.span(...) as s``,
+        e.g. when adding events in a loop: skips the context lookup that
+        :meth:`record_event` does on every call.
+        """
+        if span.is_recording():
             otel_attrs: dict[str, Any] = dict(attributes) if attributes else {}
-            current_span.add_event(name, otel_attrs)
+            span.add_event(name, otel_attrs)
 
     def shutdown(self) -> None:
         """Flush pending spans and shut down the provider.
@@ -130,6 +195,22 @@ class YgnTracer:
             self._provider = None
 
 
+def _grpc_compression(name: str) -> Any:
+    """Map a ``TelemetryConfig.compression`` name to ``grpc.Compression``."""
+    import grpc  # type: ignore[import-untyped]
+
+    mapping = {
+        "gzip": grpc.Compression.Gzip,
+        "deflate": grpc.Compression.Deflate,
+        "none": grpc.Compression.NoCompression,
+    }
+    try:
+        return mapping[name.lower()]
+    except KeyError:
+        msg = f"Unknown OTLP compression {name!r}; expected one of {sorted(mapping)}"
+        raise ValueError(msg) from None
+
+
 # ---------------------------------------------------------------------------
 # Module-level singleton (lazily initialised)
 # ---------------------------------------------------------------------------
@@ -149,29 +230,21 @@ def _get_default_tracer() -> YgnTracer:
 # ---------------------------------------------------------------------------
 
 
-@contextlib.contextmanager
-def trace_orchestrator_run(session_id: str) -> Generator[Span, None, None]:
+def trace_orchestrator_run(session_id: str) -> AbstractContextManager[Span]:
     """Trace an orchestrator run."""
-    with _get_default_tracer().span("orchestrator/run", {"session.id": session_id}) as s:
-        yield s
+    return _get_default_tracer().span("orchestrator/run", {"session.id": session_id})
 
 
-@contextlib.contextmanager
-def trace_hivemind_phase(phase: str) -> Generator[Span, None, None]:
+def trace_hivemind_phase(phase: str) -> AbstractContextManager[Span]:
     """Trace a HiveMind phase."""
-    with _get_default_tracer().span("hivemind/phase", {"hivemind.phase": phase}) as s:
-        yield s
+    return _get_default_tracer().span("hivemind/phase", {"hivemind.phase": phase})
 
 
-@contextlib.contextmanager
-def trace_guard_check(threat_level: str) -> Generator[Span, None, None]:
+def trace_guard_check(threat_level: str) -> AbstractContextManager[Span]:
     """Trace a guard check."""
-    with _get_default_tracer().span("guard/check", {"guard.threat_level": threat_level}) as s:
-        yield s
+    return _get_default_tracer().span("guard/check", {"guard.threat_level": threat_level})
 
 
-@contextlib.contextmanager
-def trace_mcp_call(tool_name: str) -> Generator[Span, None, None]:
+def trace_mcp_call(tool_name: str) -> AbstractContextManager[Span]:
     """Trace an MCP tool call."""
-    with _get_default_tracer().span("mcp/call", {"mcp.tool": tool_name}) as s:
-        yield s
+    return _get_default_tracer().span("mcp/call", {"mcp.tool": tool_name})
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import heapq
+import sys
 import time
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from typing import Any
 
 from .embeddings import EmbeddingService
 from .entity_extraction import EntityExtractor
@@ -25,7 +29,7 @@ class MemoryTier(StrEnum):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class HotEntry:
     """A hot-tier entry with a TTL expiry timestamp."""
 
@@ -35,9 +39,14 @@ class HotEntry:
     session_id: str | None
     expires_at: float  # time.time() + ttl
     tags: list[str] = field(default_factory=list)
+    # Lowercased "key content" that keyword recall searches; derived once here.
+    _search_text: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        self._search_text = f"{self.key} {self.content}".lower()
 
-@dataclass
+
+@dataclass(slots=True)
 class WarmEntry:
     """A warm-tier entry with tag-based indexing."""
 
@@ -47,9 +56,14 @@ class WarmEntry:
     session_id: str | None
     timestamp: float
     tags: list[str] = field(default_factory=list)
+    # See HotEntry._search_text.
+    _search_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._search_text = f"{self.key} {self.content}".lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class ColdEntry:
     """A cold-tier entry with relations for future knowledge-graph support."""
 
@@ -61,6 +75,135 @@ class ColdEntry:
     tags: list[str] = field(default_factory=list)
     relations: list[str] = field(default_factory=list)  # keys of related entries
     embedding: list[float] | None = None
+    # See HotEntry._search_text.
+    _search_text: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._search_text = f"{self.key} {self.content}".lower()
+
+
+# Shared result for index misses, so lookups allocate nothing.
+_EMPTY_KEYS: frozenset[str] = frozenset()
+
+# (rank, tags, session_id, lowercased "key content")
+_IndexSnapshot = tuple[int, tuple[str, ...], str | None, str]
+
+# Expiry heaps are rebuilt from the live entries once they hold more than
+# twice as many records (and at least this many); see _needs_compaction.
+_HEAP_COMPACT_MIN = 64
+
+
+class _TierIndex:
+    """Tag, session and word-token postings for one tier, plus each key's rank.
+
+    The rank mirrors the tier dict's own order (overwrites keep their slot),
+    so index-driven recall visits candidates in the same order a full scan
+    would.  Each key's indexed tags/session/text are snapshotted, so later
+    edits to an entry cannot leave stale postings behind.
+
+    Keyword recall is substring matching of whitespace-free query words, so
+    any match lies inside a single whitespace-delimited token of the text.
+    The text postings are therefore keyed by the distinct tokens of each
+    entry (3+ chars; shorter ones cannot contain a query word), and a query
+    word's candidates are the postings of every token containing it: an
+    exact prefilter that also covers partial-word queries.  Callers still
+    verify each candidate with the substring test.
+    """
+
+    __slots__ = ("_next_rank", "by_session", "by_tag", "by_token", "indexed")
+
+    def __init__(self) -> None:
+        self.by_tag: defaultdict[str, set[str]] = defaultdict(set)
+        self.by_session: defaultdict[str | None, set[str]] = defaultdict(set)
+        self.by_token: defaultdict[str, set[str]] = defaultdict(set)
+        self.indexed: dict[str, _IndexSnapshot] = {}
+        self._next_rank = 0
+
+    def add(self, key: str, tags: list[str], session_id: str | None, search_text: str) -> None:
+        """Index *key*, replacing any previous postings but keeping its rank."""
+        previous = self.indexed.get(key)
+        if previous is None:
+            rank = self._next_rank
+            self._next_rank += 1
+        else:
+            rank = previous[0]
+            self._unpost(key, previous)
+        snapshot = (rank, tuple(tags), session_id, search_text)
+        self.indexed[key] = snapshot
+        for tag in snapshot[1]:
+            self.by_tag[tag].add(key)
+        self.by_session[session_id].add(key)
+        for token in _tokens(search_text):
+            self.by_token[token].add(key)
+
+    def remove(self, key: str) -> None:
+        previous = self.indexed.pop(key, None)
+        if previous is not None:
+            self._unpost(key, previous)
+
+    def candidates(
+        self,
+        tags: list[str] | None,
+        session_id: str | None,
+        query_words: set[str],
+    ) -> list[str] | None:
+        """Keys that can satisfy the tag/session/keyword filters, in tier order.
+
+        ``None`` means no filter applies and the whole tier must be scanned.
+        """
+        keys: set[str] | None = None
+        if tags:
+            keys = set()
+            for tag in tags:
+                keys.update(self.by_tag.get(tag, ()))
+        if session_id is not None:
+            session_keys = self.by_session.get(session_id, set())
+            keys = session_keys if keys is None else keys & session_keys
+        if query_words:
+            text_keys: set[str] = set()
+            for word in query_words:
+                text_keys |= self._word_candidates(word)
+            keys = text_keys if keys is None else keys & text_keys
+        if keys is None:
+            return None
+        indexed = self.indexed
+        return sorted(keys, key=lambda k: indexed[k][0])
+
+    def _word_candidates(self, word: str) -> set[str]:
+        hits: set[str] = set()
+        for token, keys in self.by_token.items():
+            if word in token:
+                hits |= keys
+        return hits
+
+    def _unpost(self, key: str, snapshot: _IndexSnapshot) -> None:
+        _, tags, session_id, text = snapshot
+        for tag in tags:
+            _discard_posting(self.by_tag, tag, key)
+        _discard_posting(self.by_session, session_id, key)
+        for token in _tokens(text):
+            _discard_posting(self.by_token, token, key)
+
+
+def _timestamp_of(entry: MemoryEntry) -> float:
+    return entry.timestamp
+
+
+def _needs_compaction(heap: list[tuple[float, str]], live: dict[str, Any]) -> bool:
+    """Whether stale records make up most of an expiry *heap*."""
+    return len(heap) > _HEAP_COMPACT_MIN and len(heap) > 2 * len(live)
+
+
+def _tokens(text: str) -> set[str]:
+    return {token for token in text.split() if len(token) >= 3}
+
+
+def _discard_posting(index: defaultdict[Any, set[str]], name: Any, key: str) -> None:
+    posting = index.get(name)
+    if posting is not None:
+        posting.discard(key)
+        if not posting:
+            del index[name]
 
 
 # ---------------------------------------------------------------------------
@@ -84,13 +227,23 @@ class TieredMemoryService(MemoryService):
         entity_extractor: EntityExtractor | None = None,
     ) -> None:
         self._hot: dict[str, HotEntry] = {}
+        # Min-heap of (expires_at, key) for hot entries.  Records of
+        # overwritten or removed keys stay behind and are dropped when popped;
+        # the heap is rebuilt once they outnumber the live entries.
+        self._hot_expiry: list[tuple[float, str]] = []
         self._warm: dict[str, WarmEntry] = {}
+        # Min-heap of (timestamp + warm_max_age, key), kept like _hot_expiry.
+        self._warm_expiry: list[tuple[float, str]] = []
         self._cold: dict[str, ColdEntry] = {}
+        # Secondary indexes; every warm/cold mutation goes through
+        # _set_warm/_set_cold/_pop_warm/_pop_cold to keep them in step.
+        self._warm_index = _TierIndex()
+        self._cold_index = _TierIndex()
         self._hot_ttl = hot_ttl_seconds
         self._warm_max_age = warm_max_age_seconds
         self._embedding_service = embedding_service
         self._entity_extractor = entity_extractor
-        self._relation_index: dict[str, set[str]] = defaultdict(set)
+        self._relation_index: dict[str, set[str]] = {}
 
     # ----- MemoryService interface -----------------------------------------
 
@@ -105,42 +258,50 @@ class TieredMemoryService(MemoryService):
         tier: MemoryTier = MemoryTier.HOT,
     ) -> None:
         """Store an entry in the specified tier."""
-        resolved_tags = tags or []
         now = time.time()
-
+        self._insert(key, content, category, session_id, tags, tier, now=now, timestamp=now)
         if tier == MemoryTier.HOT:
-            self._hot[key] = HotEntry(
-                key=key,
-                content=content,
-                category=category,
-                session_id=session_id,
-                expires_at=now + self._hot_ttl,
-                tags=resolved_tags,
-            )
+            heapq.heappush(self._hot_expiry, (self._hot[key].expires_at, key))
+            if _needs_compaction(self._hot_expiry, self._hot):
+                self._rebuild_hot_expiry()
         elif tier == MemoryTier.WARM:
-            self._warm[key] = WarmEntry(
-                key=key,
-                content=content,
-                category=category,
-                session_id=session_id,
-                timestamp=now,
-                tags=resolved_tags,
-            )
-        else:  # COLD
-            relations: list[str] = []
-            if self._entity_extractor is not None:
-                relations = self._entity_extractor.extract(content)
-            self._cold[key] = ColdEntry(
-                key=key,
-                content=content,
-                category=category,
-                session_id=session_id,
-                timestamp=now,
-                tags=resolved_tags,
-                relations=relations,
+            heapq.heappush(self._warm_expiry, (now + self._warm_max_age, key))
+            if _needs_compaction(self._warm_expiry, self._warm):
+                self._rebuild_warm_expiry()
+
+    def bulk_load(
+        self,
+        entries: Iterable[MemoryEntry],
+        *,
+        tags: list[str] | None = None,
+        tier: MemoryTier = MemoryTier.HOT,
+    ) -> int:
+        """Load many entries into *tier* in one pass; returns how many were loaded.
+
+        Like calling :meth:`store` for each entry, except that warm and cold
+        entries keep their ``MemoryEntry.timestamp`` (so restored entries age
+        from when they were created) and the tier's expiry heap is rebuilt
+        once at the end instead of being pushed per entry.
+        """
+        now = time.time()
+        count = 0
+        for entry in entries:
+            self._insert(
+                entry.key,
+                entry.content,
+                entry.category,
+                entry.session_id,
+                tags,
+                tier,
+                now=now,
+                timestamp=entry.timestamp,
             )
-            for entity in relations:
-                self._relation_index[entity].add(key)
+            count += 1
+        if count and tier == MemoryTier.HOT:
+            self._rebuild_hot_expiry()
+        elif count and tier == MemoryTier.WARM:
+            self._rebuild_warm_expiry()
+        return count
 
     def recall(
         self,
@@ -160,21 +321,20 @@ class TieredMemoryService(MemoryService):
         now = time.time()
         results: list[MemoryEntry] = []
         query_words = {w for w in query.lower().split() if len(w) >= 3}
+        tag_set = frozenset(tags) if tags else None
 
         # --- hot ---
         if tier is None or tier == MemoryTier.HOT:
-            expired_keys: list[str] = []
-            for key, entry in self._hot.items():
+            self._purge_expired(now)
+            for entry in self._hot.values():
                 if entry.expires_at <= now:
-                    expired_keys.append(key)
                     continue
                 if not self._matches(
-                    entry.content,
-                    entry.key,
+                    entry._search_text,
                     query_words,
                     session_id,
                     entry.session_id,
-                    tags,
+                    tag_set,
                     entry.tags,
                 ):
                     continue
@@ -183,19 +343,20 @@ class TieredMemoryService(MemoryService):
                         entry.key, entry.content, entry.category, entry.session_id
                     )
                 )
-            for k in expired_keys:
-                del self._hot[k]
 
         # --- warm ---
         if tier is None or tier == MemoryTier.WARM:
-            for warm_entry in self._warm.values():
+            warm_keys = self._warm_index.candidates(tags, session_id, query_words)
+            warm_entries = (
+                self._warm.values() if warm_keys is None else [self._warm[k] for k in warm_keys]
+            )
+            for warm_entry in warm_entries:
                 if not self._matches(
-                    warm_entry.content,
-                    warm_entry.key,
+                    warm_entry._search_text,
                     query_words,
                     session_id,
                     warm_entry.session_id,
-                    tags,
+                    tag_set,
                     warm_entry.tags,
                 ):
                     continue
@@ -211,14 +372,17 @@ class TieredMemoryService(MemoryService):
 
         # --- cold ---
         if tier is None or tier == MemoryTier.COLD:
-            for cold_entry in self._cold.values():
+            cold_keys = self._cold_index.candidates(tags, session_id, query_words)
+            cold_entries = (
+                self._cold.values() if cold_keys is None else [self._cold[k] for k in cold_keys]
+            )
+            for cold_entry in cold_entries:
                 if not self._matches(
-                    cold_entry.content,
-                    cold_entry.key,
+                    cold_entry._search_text,
                     query_words,
                     session_id,
                     cold_entry.session_id,
-                    tags,
+                    tag_set,
                     cold_entry.tags,
                 ):
                     continue
@@ -232,13 +396,13 @@ class TieredMemoryService(MemoryService):
                     )
                 )
 
-        # Most recent first
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-        return results[:limit]
+        # Most recent first.  nlargest keeps only *limit* candidates on a heap
+        # and breaks ties in scan order, exactly like sort-then-slice.
+        return heapq.nlargest(limit, results, key=_timestamp_of)
 
     def recall_by_relation(self, entity: str) -> list[MemoryEntry]:
         """Return cold-tier entries that mention *entity* in their relations."""
-        keys = self._relation_index.get(entity, set())
+        keys = self._relation_index.get(entity, _EMPTY_KEYS)
         results: list[MemoryEntry] = []
         for k in keys:
             entry = self._cold.get(k)
@@ -260,18 +424,24 @@ class TieredMemoryService(MemoryService):
         seen_keys: set[str] = set()
         # Seed: entities to explore at the current hop
         frontier: set[str] = {query}
+        # Every entity explored at any hop; each is expanded at most once.
+        seen_entities: set[str] = {query}
 
         for _ in range(hops):
+            if not frontier:
+                break
             next_frontier: set[str] = set()
             for entity in frontier:
-                for key in self._relation_index.get(entity, set()):
+                for key in self._relation_index.get(entity, _EMPTY_KEYS):
                     if key not in seen_keys:
                         seen_keys.add(key)
                         cold_entry = self._cold.get(key)
                         if cold_entry is not None:
                             # Add this entry's relations to the next frontier
                             next_frontier.update(cold_entry.relations)
-            frontier = next_frontier - frontier  # avoid re-exploring same entities
+            next_frontier -= seen_entities
+            seen_entities |= next_frontier
+            frontier = next_frontier
 
         results: list[MemoryEntry] = []
         for k in seen_keys:
@@ -295,11 +465,9 @@ class TieredMemoryService(MemoryService):
         if key in self._hot:
             del self._hot[key]
             found = True
-        if key in self._warm:
-            del self._warm[key]
+        if self._pop_warm(key) is not None:
             found = True
-        if key in self._cold:
-            del self._cold[key]
+        if self._pop_cold(key) is not None:
             found = True
         return found
 
@@ -319,8 +487,8 @@ class TieredMemoryService(MemoryService):
 
         # Remove from all tiers first
         self._hot.pop(key, None)
-        self._warm.pop(key, None)
-        self._cold.pop(key, None)
+        self._pop_warm(key)
+        self._pop_cold(key)
 
         # Store in target tier
         self.store(key, content, category, session_id, tags=tags, tier=target_tier)
@@ -337,48 +505,181 @@ class TieredMemoryService(MemoryService):
         now = time.time()
 
         # Evict expired hot entries
-        expired_hot = [k for k, e in self._hot.items() if e.expires_at <= now]
-        for k in expired_hot:
-            del self._hot[k]
+        evicted_hot = self._purge_expired(now)
 
         # Promote aged warm entries to cold
-        aged_warm = [k for k, e in self._warm.items() if (now - e.timestamp) >= self._warm_max_age]
-        for k in aged_warm:
-            entry = self._warm.pop(k)
-            self._cold[k] = ColdEntry(
-                key=entry.key,
-                content=entry.content,
-                category=entry.category,
-                session_id=entry.session_id,
-                timestamp=entry.timestamp,
-                tags=entry.tags,
+        aged_warm = self._pop_aged_warm(now)
+        for entry in aged_warm:
+            self._set_cold(
+                ColdEntry(
+                    key=entry.key,
+                    content=entry.content,
+                    category=entry.category,
+                    session_id=entry.session_id,
+                    timestamp=entry.timestamp,
+                    tags=entry.tags,
+                )
             )
 
-        return (len(expired_hot), len(aged_warm))
+        return (evicted_hot, len(aged_warm))
+
+    def next_decay_at(self) -> float | None:
+        """Earliest time at which :meth:`decay` may have work to do.
+
+        Schedulers can sleep until then instead of polling.  The value can be
+        early (a superseded deadline), never late; ``None`` means no hot or
+        warm entry is pending.
+        """
+        heads = [heap[0][0] for heap in (self._hot_expiry, self._warm_expiry) if heap]
+        return min(heads, default=None)
 
     # ----- Internals -------------------------------------------------------
 
+    def _insert(
+        self,
+        key: str,
+        content: str,
+        category: MemoryCategory,
+        session_id: str | None,
+        tags: list[str] | None,
+        tier: MemoryTier,
+        *,
+        now: float,
+        timestamp: float,
+    ) -> None:
+        """Place an entry in *tier* and its indexes; callers own the expiry heaps."""
+        # Copied: entries must not alias (and the tag index must not track)
+        # a list the caller may keep mutating.
+        resolved_tags = list(tags) if tags else []
+        if session_id is not None:
+            # Few distinct sessions, many entries: share one string each.
+            session_id = sys.intern(session_id)
+
+        if tier == MemoryTier.HOT:
+            self._hot[key] = HotEntry(
+                key=key,
+                content=content,
+                category=category,
+                session_id=session_id,
+                expires_at=now + self._hot_ttl,
+                tags=resolved_tags,
+            )
+        elif tier == MemoryTier.WARM:
+            self._set_warm(
+                WarmEntry(
+                    key=key,
+                    content=content,
+                    category=category,
+                    session_id=session_id,
+                    timestamp=timestamp,
+                    tags=resolved_tags,
+                )
+            )
+        else:  # COLD
+            relations: list[str] = []
+            if self._entity_extractor is not None:
+                relations = self._entity_extractor.extract(content)
+            self._set_cold(
+                ColdEntry(
+                    key=key,
+                    content=content,
+                    category=category,
+                    session_id=session_id,
+                    timestamp=timestamp,
+                    tags=resolved_tags,
+                    relations=relations,
+                )
+            )
+            for entity in relations:
+                self._relation_index.setdefault(entity, set()).add(key)
+
+    def _set_warm(self, entry: WarmEntry) -> None:
+        self._warm[entry.key] = entry
+        self._warm_index.add(entry.key, entry.tags, entry.session_id, entry._search_text)
+
+    def _set_cold(self, entry: ColdEntry) -> None:
+        self._cold[entry.key] = entry
+        self._cold_index.add(entry.key, entry.tags, entry.session_id, entry._search_text)
+
+    def _pop_warm(self, key: str) -> WarmEntry | None:
+        self._warm_index.remove(key)
+        return self._warm.pop(key, None)
+
+    def _pop_cold(self, key: str) -> ColdEntry | None:
+        self._cold_index.remove(key)
+        return self._cold.pop(key, None)
+
+    def _purge_expired(self, now: float) -> int:
+        """Evict hot entries expired at *now*; returns how many were evicted.
+
+        Only the expired prefix of the expiry heap is visited, so the cost is
+        independent of the hot-tier size when nothing has expired.
+        """
+        heap = self._hot_expiry
+        evicted = 0
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self._hot.get(key)
+            if entry is None:
+                continue
+            if entry.expires_at <= now:
+                del self._hot[key]
+                evicted += 1
+            # Otherwise this is a stale record of a key stored again; store()
+            # already pushed the live deadline, so the record is dropped.
+        return evicted
+
+    def _rebuild_hot_expiry(self) -> None:
+        """Rebuild the hot expiry heap from the live entries alone."""
+        self._hot_expiry = [(e.expires_at, k) for k, e in self._hot.items()]
+        heapq.heapify(self._hot_expiry)
+
+    def _pop_aged_warm(self, now: float) -> list[WarmEntry]:
+        """Remove and return warm entries aged out at *now*, in tier order.
+
+        Like :meth:`_purge_expired`, only the due prefix of the deadline heap
+        is visited.
+        """
+        heap = self._warm_expiry
+        indexed = self._warm_index.indexed
+        aged: list[tuple[int, WarmEntry]] = []
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = self._warm.get(key)
+            if entry is None:
+                continue
+            if entry.timestamp + self._warm_max_age <= now:
+                aged.append((indexed[key][0], entry))
+                self._pop_warm(key)
+            # Otherwise a stale record of a re-stored key: dropped, as in
+            # _purge_expired.
+        # Promote in the order a full scan of the tier would have.
+        aged.sort(key=lambda ranked: ranked[0])
+        return [entry for _, entry in aged]
+
+    def _rebuild_warm_expiry(self) -> None:
+        """Rebuild the warm deadline heap from the live entries alone."""
+        max_age = self._warm_max_age
+        self._warm_expiry = [(e.timestamp + max_age, k) for k, e in self._warm.items()]
+        heapq.heapify(self._warm_expiry)
+
     @staticmethod
     def _matches(
-        content: str,
-        key: str,
+        search_text: str,
         query_words: set[str],
         session_filter: str | None,
         entry_session: str | None,
-        tag_filter: list[str] | None,
+        tag_filter: frozenset[str] | None,
         entry_tags: list[str],
     ) -> bool:
-        """Check if an entry matches search criteria."""
+        """Check if an entry matches search criteria, cheapest test first."""
         if session_filter is not None and entry_session != session_filter:
             return False
-        if tag_filter:
-            tag_set = set(tag_filter)
-            if not tag_set.intersection(entry_tags):
-                return False
+        if tag_filter is not None and tag_filter.isdisjoint(entry_tags):
+            return False
         if not query_words:
             return True
-        entry_text = f"{key} {content}".lower()
-        return any(word in entry_text for word in query_words)
+        return any(word in search_text for word in query_words)
 
     @staticmethod
     def _to_memory_entry(
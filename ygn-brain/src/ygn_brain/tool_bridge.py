@@ -17,6 +17,7 @@ class McpToolBridge:
     def __init__(self, mcp_client: McpClient) -> None:
         self.client = mcp_client
         self._tools: list[dict[str, Any]] = []
+        self._tools_by_name: dict[str, dict[str, Any]] = {}
 
     async def discover(self) -> list[dict[str, Any]]:
         """Discover and cache available tools from the MCP server.
@@ -25,6 +26,7 @@ class McpToolBridge:
             A list of tool specification dicts.
         """
         self._tools = await self.client.list_tools()
+        self._tools_by_name = {tool["name"]: tool for tool in self._tools if "name" in tool}
         return self._tools
 
     async def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
@@ -39,6 +41,10 @@ class McpToolBridge:
         """
         return await self.client.call_tool(tool_name, arguments)
 
+    def get_tool(self, tool_name: str) -> dict[str, Any] | None:
+        """Return the cached spec for *tool_name*, or ``None`` if not discovered."""
+        return self._tools_by_name.get(tool_name)
+
     @property
     def available_tools(self) -> list[dict[str, Any]]:
         """Return the cached list of tool specs (populated by :meth:`discover`)."""
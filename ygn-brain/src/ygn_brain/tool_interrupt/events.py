@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import secrets
+import sys
 import time
-import uuid
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any
@@ -41,11 +42,12 @@ class ToolEvent:
         latency_ms: float = 0.0,
         normalized: dict[str, Any] | None = None,
     ) -> ToolEvent:
+        now = time.time()
         return cls(
-            event_id=f"{int(time.time() * 1000):012x}-{uuid.uuid4().hex[:12]}",
-            timestamp=time.time(),
+            event_id=f"{int(now * 1000):012x}-{secrets.token_hex(6)}",
+            timestamp=now,
             kind=kind,
-            tool_name=tool_name,
+            tool_name=sys.intern(tool_name),
             arguments=arguments or {},
             result=result,
             error=error,
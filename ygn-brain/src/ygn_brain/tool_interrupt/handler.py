@@ -43,30 +43,37 @@ class ToolInterruptHandler:
             token_estimate=10,
         )
 
-        start = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         try:
             # 2. Execute with timeout
             result = await asyncio.wait_for(
                 self._bridge.execute(tool_name, arguments),
                 timeout=timeout_sec,
             )
-            latency = (time.perf_counter() - start) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1e6
 
             # 3. Normalize
-            normalized = self._normalizer.normalize(tool_name, str(result))
+            result_str = result if isinstance(result, str) else str(result)
+            normalized = self._normalizer.normalize(tool_name, result_str)
+
+            # Completion events are recorded together once the call is done.
+            completed: list[tuple[str, dict[str, Any], int]] = []
 
             # 4. Externalize if large
-            result_str = str(result)
-            if self._artifact_store and len(result_str.encode()) >= self._threshold:
-                handle = self._artifact_store.store(
-                    result_str.encode(),
-                    source=f"tool:{tool_name}",
-                )
-                self._session.record(
-                    "artifact_stored",
-                    {"handle": handle.artifact_id, "source": handle.source},
-                    token_estimate=10,
-                )
+            if self._artifact_store:
+                result_bytes = result_str.encode()
+                if len(result_bytes) >= self._threshold:
+                    handle = self._artifact_store.store(
+                        result_bytes,
+                        source=f"tool:{tool_name}",
+                    )
+                    completed.append(
+                        (
+                            "artifact_stored",
+                            {"handle": handle.artifact_id, "source": handle.source},
+                            10,
+                        )
+                    )
 
             # 5. Emit SUCCESS event
             event = ToolEvent.create(
@@ -77,15 +84,12 @@ class ToolInterruptHandler:
                 latency_ms=latency,
                 normalized=normalized,
             )
-            self._session.record(
-                "tool_success",
-                {"tool_name": tool_name, "latency_ms": latency},
-                token_estimate=5,
-            )
+            completed.append(("tool_success", {"tool_name": tool_name, "latency_ms": latency}, 5))
+            self._session.record_many(completed)
             return event
 
         except TimeoutError:
-            latency = (time.perf_counter() - start) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1e6
             event = ToolEvent.create(
                 kind=ToolEventKind.TIMEOUT,
                 tool_name=tool_name,
@@ -101,7 +105,7 @@ class ToolInterruptHandler:
             return event
 
         except Exception as exc:
-            latency = (time.perf_counter() - start) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1e6
             event = ToolEvent.create(
                 kind=ToolEventKind.ERROR,
                 tool_name=tool_name,
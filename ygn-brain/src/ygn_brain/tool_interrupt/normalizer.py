@@ -8,6 +8,13 @@ from typing import Any
 
 from .schemas import SchemaRegistry
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
+
 _SECRET_PATTERNS = [
     (re.compile(r"sk-[A-Za-z0-9]{8,}"), "[REDACTED_API_KEY]"),
     (re.compile(r"Bearer\s+[A-Za-z0-9._\-]{10,}"), "[REDACTED_BEARER]"),
@@ -19,25 +26,59 @@ _SECRET_PATTERNS = [
 ]
 
 
+# Union of every secret pattern, used only to answer "any secret at all?" in
+# one scan.  Redaction itself stays sequential: a single alternation would
+# let an earlier, shorter match (``password=Bearer``) shadow a later pattern
+# (the bearer token after it).
+_ANY_SECRET = re.compile(
+    "|".join(
+        # Inline "(?i)" is only legal at the start, so scope it per branch.
+        f"(?i:{p.pattern.removeprefix('(?i)')})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p, _ in _SECRET_PATTERNS
+    )
+)
+
+
 def _redact(text: str) -> tuple[str, list[str]]:
     """Redact secrets from text. Returns (redacted_text, list of redacted field names)."""
+    if not _ANY_SECRET.search(text):
+        return text, []
     redacted_fields: list[str] = []
     result = text
     for pattern, replacement in _SECRET_PATTERNS:
-        if pattern.search(result):
+        result, count = pattern.subn(replacement, result)
+        if count:
             redacted_fields.append(replacement)
-            result = pattern.sub(replacement, result)
     return result, redacted_fields
 
 
+# Every JSON document (including the NaN/Infinity the stdlib accepts) starts
+# with one of these after JSON whitespace; anything else, such as plain-text
+# tool output, is not handed to the parser just to raise.
+_JSON_START = re.compile(r'[ \t\n\r]*[{\["\-0-9tfnNI]')
+
+
+def _loads(text: str) -> Any:
+    """Parse JSON with orjson when installed, with stdlib ``json`` semantics.
+
+    orjson is stricter (no NaN/Infinity, no integers beyond 64 bits), so
+    anything it rejects is handed to ``json.loads`` for the final word.
+    """
+    if _HAVE_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
 def _truncate(text: str, max_len: int) -> str:
     if len(text) <= max_len:
         return text
-    truncated = text[:max_len]
-    last_space = truncated.rfind(" ")
-    if last_space > max_len // 2:
-        truncated = truncated[:last_space]
-    return truncated + "..."
+    # Break at the last space in the back half of the window, if any: the
+    # search never leaves that range and the text is sliced only once.
+    last_space = text.rfind(" ", max_len // 2 + 1, max_len)
+    return text[: last_space if last_space != -1 else max_len] + "..."
 
 
 class PerceptionAligner:
@@ -48,22 +89,30 @@ class PerceptionAligner:
 
     def normalize(self, tool_name: str, raw_output: str) -> dict[str, Any]:
         """Normalize a raw tool output string."""
-        parsed: Any = None
+        parsed: Any = raw_output
         is_json = False
-        try:
-            parsed = json.loads(raw_output)
-            is_json = True
-        except (json.JSONDecodeError, TypeError):
-            parsed = raw_output
+        if not isinstance(raw_output, str) or _JSON_START.match(raw_output):
+            try:
+                parsed = _loads(raw_output)
+                is_json = True
+            except (json.JSONDecodeError, TypeError):
+                parsed = raw_output
 
         validation_errors: list[str] = []
         valid = True
         if is_json:
             valid, validation_errors = self._registry.validate(tool_name, parsed)
 
-        redacted_text, redacted_fields = _redact(
-            json.dumps(parsed) if is_json else str(parsed)
-        )
+        # A str that already is the JSON is redacted as-is; re-serializing is
+        # only needed to decode escapes, which could otherwise hide a secret
+        # from the redaction patterns (e.g. "\u0073k-...").  Without a
+        # backslash, decoding changes nothing.  Non-str output (bytes, numbers,
+        # None) is always rendered from the parsed value.
+        is_str = isinstance(raw_output, str)
+        if is_json and (not is_str or "\\" in raw_output):
+            redacted_text, redacted_fields = _redact(json.dumps(parsed))
+        else:
+            redacted_text, redacted_fields = _redact(raw_output if is_str else str(parsed))
 
         summary_concise = _truncate(redacted_text, 200)
         summary_detailed = _truncate(redacted_text, 2000)
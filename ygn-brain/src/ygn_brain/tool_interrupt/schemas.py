@@ -4,6 +4,13 @@ from __future__ import annotations
 
 from typing import Any
 
+# JSON Schema primitive types checked per property, as isinstance() targets.
+_TYPE_CHECKS: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "number": (int, float),
+    "boolean": bool,
+}
+
 
 class SchemaRegistry:
     """Registry of per-tool output JSON Schemas."""
@@ -23,27 +30,27 @@ class SchemaRegistry:
         if schema is None:
             return True, []
 
-        errors: list[str] = []
-        expected_type = schema.get("type")
-        if expected_type == "object" and not isinstance(data, dict):
-            errors.append(f"Expected object, got {type(data).__name__}")
-            return False, errors
-
-        if expected_type == "object" and isinstance(data, dict):
-            for field in schema.get("required", []):
-                if field not in data:
-                    errors.append(f"Missing required field: {field}")
-
-            props = schema.get("properties", {})
-            for key, val in data.items():
-                if key in props:
-                    prop_type = props[key].get("type")
-                    if prop_type == "string" and not isinstance(val, str):
-                        errors.append(f"Field '{key}': expected string, got {type(val).__name__}")
-                    elif prop_type == "number" and not isinstance(val, (int, float)):
-                        errors.append(f"Field '{key}': expected number, got {type(val).__name__}")
-                    elif prop_type == "boolean" and not isinstance(val, bool):
-                        errors.append(f"Field '{key}': expected boolean, got {type(val).__name__}")
+        if schema.get("type") != "object":
+            return True, []
+        if not isinstance(data, dict):
+            return False, [f"Expected object, got {type(data).__name__}"]
+
+        errors = [
+            f"Missing required field: {field}"
+            for field in schema.get("required", [])
+            if field not in data
+        ]
+
+        props = schema.get("properties", {})
+        for key, val in data.items():
+            prop = props.get(key)
+            if prop is None:
+                continue
+            prop_type = prop.get("type")
+            # Union types (e.g. ["string", "null"]) are not checked.
+            expected = _TYPE_CHECKS.get(prop_type) if isinstance(prop_type, str) else None
+            if expected is not None and not isinstance(val, expected):
+                errors.append(f"Field '{key}': expected {prop_type}, got {type(val).__name__}")
 
         return len(errors) == 0, errors
 
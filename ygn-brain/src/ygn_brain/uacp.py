@@ -52,6 +52,11 @@ _BYTE_TO_VERB: dict[int, UacpVerb] = {v: k for k, v in _VERB_TO_BYTE.items()}
 # Minimum header: 1 (verb) + 4 (msg_id) + 8 (ts) + 2 (sender_len) + 4 (payload_len) = 19
 _MIN_HEADER_SIZE = 19
 
+# Pre-compiled frame parts: the fixed head before the sender bytes, and the
+# payload length that follows them.
+_HEAD = struct.Struct(">BIQH")
+_PAYLOAD_LEN = struct.Struct(">I")
+
 
 @dataclass
 class UacpMessage:
@@ -111,7 +116,8 @@ class UacpMessage:
 
 
 def _now_millis() -> int:
-    return int(time.time() * 1000)
+    # Integer clock: no float rounding at millisecond precision.
+    return time.time_ns() // 1_000_000
 
 
 # ---------------------------------------------------------------------------
@@ -126,75 +132,27 @@ class UacpCodec:
     def encode(msg: UacpMessage) -> bytes:
         """Serialize a single message to the binary wire format."""
         sender_bytes = msg.sender_id.encode("utf-8")
-        header = struct.pack(
-            ">BIQ",
+        head = _HEAD.pack(
             _VERB_TO_BYTE[msg.verb],
             msg.message_id,
             msg.timestamp,
+            len(sender_bytes),
         )
-        sender_hdr = struct.pack(">H", len(sender_bytes))
-        payload_hdr = struct.pack(">I", len(msg.payload))
-        return header + sender_hdr + sender_bytes + payload_hdr + msg.payload
+        # One join: the payload is copied exactly once, into the frame.
+        return b"".join((head, sender_bytes, _PAYLOAD_LEN.pack(len(msg.payload)), msg.payload))
 
     @staticmethod
     def decode(data: bytes | bytearray | memoryview) -> UacpMessage:
         """Deserialize a single message from the binary wire format."""
-        raw = bytes(data)
-        if len(raw) < _MIN_HEADER_SIZE:
-            msg = f"uACP frame too short: {len(raw)} bytes (minimum {_MIN_HEADER_SIZE})"
-            raise ValueError(msg)
-
-        pos = 0
-
-        # verb
-        verb_byte = raw[pos]
-        if verb_byte not in _BYTE_TO_VERB:
-            msg = f"invalid uACP verb byte: 0x{verb_byte:02x}"
-            raise ValueError(msg)
-        verb = _BYTE_TO_VERB[verb_byte]
-        pos += 1
-
-        # message_id + timestamp
-        (message_id, timestamp) = struct.unpack_from(">IQ", raw, pos)
-        pos += 12
-
-        # sender
-        (sender_len,) = struct.unpack_from(">H", raw, pos)
-        pos += 2
-
-        if pos + sender_len > len(raw):
-            msg = f"uACP sender_len ({sender_len}) exceeds remaining data ({len(raw) - pos})"
-            raise ValueError(msg)
-
-        sender_raw = raw[pos : pos + sender_len]
-        try:
-            sender_id = sender_raw.decode("utf-8")
-        except UnicodeDecodeError as exc:
-            msg = "uACP sender_id is not valid UTF-8"
-            raise ValueError(msg) from exc
-        pos += sender_len
-
-        # payload
-        if pos + 4 > len(raw):
-            msg = "uACP frame truncated: missing payload_len"
-            raise ValueError(msg)
-
-        (payload_len,) = struct.unpack_from(">I", raw, pos)
-        pos += 4
-
-        if pos + payload_len > len(raw):
-            msg = f"uACP payload_len ({payload_len}) exceeds remaining data ({len(raw) - pos})"
-            raise ValueError(msg)
-
-        payload = raw[pos : pos + payload_len]
-
-        return UacpMessage(
-            verb=verb,
-            message_id=message_id,
-            sender_id=sender_id,
-            payload=payload,
-            timestamp=timestamp,
-        )
+        # A byte view, not a copy: only the sender and payload are copied out.
+        # The views are released on the way out, even when decoding raises, so
+        # a caller's bytearray is not left exported (and thus unresizable).
+        with memoryview(data) as view, view.cast("B") as raw:
+            if len(raw) < _MIN_HEADER_SIZE:
+                msg = f"uACP frame too short: {len(raw)} bytes (minimum {_MIN_HEADER_SIZE})"
+                raise ValueError(msg)
+            message, _ = _decode_at(raw, 0)
+        return message
 
     @staticmethod
     def encode_batch(msgs: list[UacpMessage]) -> bytes:
@@ -204,29 +162,64 @@ class UacpCodec:
     @staticmethod
     def decode_batch(data: bytes | bytearray | memoryview) -> list[UacpMessage]:
         """Decode all messages from a concatenated buffer."""
-        raw = bytes(data)
         msgs: list[UacpMessage] = []
         pos = 0
 
-        while pos < len(raw):
-            if pos + _MIN_HEADER_SIZE > len(raw):
-                msg = f"uACP batch: trailing {len(raw) - pos} bytes too short for a header"
-                raise ValueError(msg)
-
-            # Peek at sender_len to compute frame size.
-            (sender_len,) = struct.unpack_from(">H", raw, pos + 13)
-            pl_off = pos + 15 + sender_len
-            if pl_off + 4 > len(raw):
-                msg = "uACP batch: frame truncated at payload_len"
-                raise ValueError(msg)
-            (payload_len,) = struct.unpack_from(">I", raw, pl_off)
+        with memoryview(data) as view, view.cast("B") as raw:
+            while pos < len(raw):
+                if pos + _MIN_HEADER_SIZE > len(raw):
+                    msg = f"uACP batch: trailing {len(raw) - pos} bytes too short for a header"
+                    raise ValueError(msg)
+                message, pos = _decode_at(raw, pos)
+                msgs.append(message)
 
-            frame_len = _MIN_HEADER_SIZE + sender_len + payload_len
-            if pos + frame_len > len(raw):
-                msg = "uACP batch: frame overflows buffer"
-                raise ValueError(msg)
+        return msgs
 
-            msgs.append(UacpCodec.decode(raw[pos : pos + frame_len]))
-            pos += frame_len
 
-        return msgs
+def _decode_at(raw: memoryview, pos: int) -> tuple[UacpMessage, int]:
+    """Decode the frame starting at *pos*; returns it and the offset just past it.
+
+    The caller guarantees at least ``_MIN_HEADER_SIZE`` bytes from *pos*.
+    Every field is read exactly once, straight from *raw*.
+    """
+    # verb, message_id, timestamp, sender_len
+    verb_byte, message_id, timestamp, sender_len = _HEAD.unpack_from(raw, pos)
+    verb = _BYTE_TO_VERB.get(verb_byte)
+    if verb is None:
+        msg = f"invalid uACP verb byte: 0x{verb_byte:02x}"
+        raise ValueError(msg)
+    pos += _HEAD.size
+
+    if pos + sender_len > len(raw):
+        msg = f"uACP sender_len ({sender_len}) exceeds remaining data ({len(raw) - pos})"
+        raise ValueError(msg)
+
+    try:
+        sender_id = str(raw[pos : pos + sender_len], "utf-8")
+    except UnicodeDecodeError as exc:
+        msg = "uACP sender_id is not valid UTF-8"
+        raise ValueError(msg) from exc
+    pos += sender_len
+
+    # payload
+    if pos + _PAYLOAD_LEN.size > len(raw):
+        msg = "uACP frame truncated: missing payload_len"
+        raise ValueError(msg)
+
+    (payload_len,) = _PAYLOAD_LEN.unpack_from(raw, pos)
+    pos += _PAYLOAD_LEN.size
+
+    if pos + payload_len > len(raw):
+        msg = f"uACP payload_len ({payload_len}) exceeds remaining data ({len(raw) - pos})"
+        raise ValueError(msg)
+
+    payload = bytes(raw[pos : pos + payload_len])
+
+    message = UacpMessage(
+        verb=verb,
+        message_id=message_id,
+        sender_id=sender_id,
+        payload=payload,
+        timestamp=timestamp,
+    )
+    return message, pos + payload_len
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -58,19 +59,22 @@ _ACTION_KEYWORDS: dict[str, tuple[list[str], float]] = {
     "sense": (["measure", "sense", "check", "detect", "monitor", "read"], 0.75),
 }
 
+# Keywords match whole words only ("go" must not fire on "good" or "ago").
+_WORD_RE = re.compile(r"\w+")
+
 
 class StubVLAAdapter(VLAAdapter):
     """Keyword-based stub that maps instructions to hardware action dicts."""
 
     async def predict(self, vla_input: VLAInput) -> VLAOutput:
         """Map instruction keywords to hardware actions."""
-        lower = vla_input.instruction.lower()
+        words = set(_WORD_RE.findall(vla_input.instruction.lower()))
         actions: list[dict[str, Any]] = []
         total_confidence = 0.0
         reasons: list[str] = []
 
         for action_type, (keywords, base_confidence) in _ACTION_KEYWORDS.items():
-            matched = [kw for kw in keywords if kw in lower]
+            matched = [kw for kw in keywords if kw in words]
             if matched:
                 action: dict[str, Any] = {
                     "type": action_type,
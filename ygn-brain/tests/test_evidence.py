@@ -128,6 +128,34 @@ def test_hash_chain_integrity():
     assert pack.verify()
 
 
+def test_extend_chains_like_add():
+    """extend() appends entries chained to the existing tail."""
+    pack = EvidencePack(session_id="extend_test")
+    pack.add("diagnosis", "input", {"text": "hi"})
+    pack.extend(
+        [
+            ("execution", "tool_call", {"tool": "echo"}),
+            ("execution", "decision", None),
+        ]
+    )
+
+    assert [e.kind for e in pack.entries] == ["input", "tool_call", "decision"]
+    assert pack.entries[1].prev_hash == pack.entries[0].entry_hash
+    assert pack.entries[2].prev_hash == pack.entries[1].entry_hash
+    assert pack.entries[2].data == {}
+    assert pack.end_time == pack.entries[-1].timestamp
+    assert pack.verify()
+
+
+def test_extend_invalid_kind_leaves_pack_unchanged():
+    pack = EvidencePack(session_id="extend_invalid")
+    with pytest.raises(ValueError, match="bogus"):
+        pack.extend([("p", "input", {}), ("p", "bogus", {})])
+    assert pack.entries == []
+    pack.extend([])
+    assert pack.start_time == 0.0
+
+
 def test_hash_chain_tamper_detection():
     """Modifying an entry's data makes verify() return False."""
     pack = EvidencePack(session_id="tamper_test")
@@ -244,6 +244,8 @@ async def test_tool_bridge_discover() -> None:
         tools = await bridge.discover()
         assert len(tools) == 1
         assert bridge.available_tools == tools
+        assert bridge.get_tool("echo") is tools[0]
+        assert bridge.get_tool("missing") is None
 
 
 @pytest.mark.asyncio
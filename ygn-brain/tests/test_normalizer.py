@@ -1,6 +1,9 @@
 """Tests for PerceptionAligner and SchemaRegistry."""
 
-from ygn_brain.tool_interrupt.normalizer import PerceptionAligner
+import pytest
+
+from ygn_brain.tool_interrupt import normalizer as normalizer_module
+from ygn_brain.tool_interrupt.normalizer import PerceptionAligner, _redact
 from ygn_brain.tool_interrupt.schemas import SchemaRegistry
 
 
@@ -68,3 +71,124 @@ def test_normalizer_validates_against_schema():
     result2 = aligner.normalize("calc", '{"wrong": "field"}')
     assert not result2["valid"]
     assert len(result2["validation_errors"]) > 0
+
+
+def test_redact_fast_path_agrees_with_each_pattern():
+    samples = [
+        "key sk-abcdefgh1234",
+        "Authorization: Bearer abcdefghijklmno",
+        "PASSWORD = hunter2",
+        "Api-Key: 123",
+        "secret:xyz",
+        "ghp_" + "a" * 36,
+        "gho_" + "b" * 36,
+    ]
+    for sample in samples:
+        redacted, fields = _redact(sample)
+        assert fields, sample
+        assert redacted != sample
+    assert _redact("nothing to hide here") == ("nothing to hide here", [])
+    # Overlapping secrets are all redacted, in pattern order.
+    assert _redact("password=Bearer abcdefghijkl") == (
+        "[REDACTED_PASSWORD]",
+        ["[REDACTED_BEARER]", "[REDACTED_PASSWORD]"],
+    )
+
+
+def test_normalizer_summarizes_raw_json_and_decodes_escaped_secrets():
+    aligner = PerceptionAligner(schema_registry=SchemaRegistry())
+
+    raw = '{"items":[1,2],"name":"café"}'
+    result = aligner.normalize("tool", raw)
+    assert result["summary_concise"] == raw
+    assert result["data"] == {"items": [1, 2], "name": "café"}
+
+    escaped = '{"token": "\\u0073k-abcdefgh1234"}'
+    result = aligner.normalize("tool", escaped)
+    assert "abcdefgh1234" not in result["summary_detailed"]
+    assert result["redacted_fields"] == ["[REDACTED_API_KEY]"]
+
+
+@pytest.mark.parametrize("have_orjson", [True, False])
+def test_normalizer_json_parsing_matches_stdlib(monkeypatch, have_orjson):
+    if not have_orjson:
+        monkeypatch.setattr(normalizer_module, "_HAVE_ORJSON", False)
+    aligner = PerceptionAligner(schema_registry=SchemaRegistry())
+
+    result = aligner.normalize("tool", '{"ratio": NaN, "big": 123456789012345678901234567890}')
+    assert result["data"]["big"] == 123456789012345678901234567890
+    assert result["data"]["ratio"] != result["data"]["ratio"]  # NaN
+
+    assert aligner.normalize("tool", "not json")["data"] == "not json"
+
+
+def test_truncate_breaks_at_a_late_space_only():
+    assert normalizer_module._truncate("short", 10) == "short"
+    assert normalizer_module._truncate("aaaa bbbb cccc", 12) == "aaaa bbbb..."
+    # The only space sits in the first half: hard cut instead.
+    assert normalizer_module._truncate("ab cdefghijklmnop", 10) == "ab cdefghi..."
+
+
+def test_schema_registry_checks_property_types():
+    reg = SchemaRegistry()
+    reg.register(
+        "t",
+        {
+            "type": "object",
+            "required": ["a", "z"],
+            "properties": {
+                "a": {"type": "string"},
+                "n": {"type": "number"},
+                "b": {"type": "boolean"},
+                "u": {"type": ["string", "null"]},
+                "o": {"type": "object"},
+            },
+        },
+    )
+    assert reg.validate("t", {"a": "x", "z": 1, "n": 2.5, "b": False, "u": None, "o": 3}) == (
+        True,
+        [],
+    )
+    assert reg.validate("t", {"a": 1, "n": "2", "b": "no", "extra": 0}) == (
+        False,
+        [
+            "Missing required field: z",
+            "Field 'a': expected string, got int",
+            "Field 'n': expected number, got str",
+            "Field 'b': expected boolean, got str",
+        ],
+    )
+    assert reg.validate("t", [1]) == (False, ["Expected object, got list"])
+    reg.register("s", {"type": "string"})
+    assert reg.validate("s", 5) == (True, [])
+
+
+def test_normalizer_skips_parser_for_plain_text(monkeypatch):
+    calls = []
+    real_loads = normalizer_module._loads
+
+    def spy(text):
+        calls.append(text)
+        return real_loads(text)
+
+    monkeypatch.setattr(normalizer_module, "_loads", spy)
+    aligner = PerceptionAligner(schema_registry=SchemaRegistry())
+
+    assert aligner.normalize("tool", "Error: file not found")["data"] == "Error: file not found"
+    assert aligner.normalize("tool", "")["data"] == ""
+    assert calls == []
+
+    for raw, data in [(" 42", 42), ('"quoted"', "quoted"), ("\n[true]", [True]), ("null", None)]:
+        assert aligner.normalize("tool", raw)["data"] == data
+    assert aligner.normalize("tool", "fail")["data"] == "fail"  # parsed, rejected
+    assert len(calls) == 5
+
+
+@pytest.mark.parametrize(
+    ("raw", "summary"), [(b'{"a":1}', '{"a": 1}'), (123, "123"), (None, "None")]
+)
+def test_normalizer_accepts_non_str_output(raw, summary):
+    aligner = PerceptionAligner(schema_registry=SchemaRegistry())
+    result = aligner.normalize("tool", raw)
+    assert result["summary_concise"] == summary
+    assert result["summary_detailed"] == summary
@@ -1,7 +1,12 @@
 """Tests for Orchestrator module."""
 
+import asyncio
+
+import pytest
+
 from ygn_brain.fsm import Phase
 from ygn_brain.orchestrator import Orchestrator
+from ygn_brain.provider import StubLLMProvider
 
 
 def test_orchestrator_run():
@@ -24,3 +29,59 @@ def test_orchestrator_produces_evidence():
     phases = {e.phase for e in orch.evidence.entries}
     assert "diagnosis" in phases
     assert "synthesis" in phases
+
+
+def test_orchestrator_reset_starts_new_session():
+    orch = Orchestrator()
+    orch.run("test input")
+    old_session = orch.evidence.session_id
+    guard = orch._guard_pipeline
+    orch.reset()
+    assert orch.evidence.session_id != old_session
+    assert orch.evidence.entries == []
+    assert orch.state.phase == Phase.IDLE
+    assert orch._guard_pipeline is guard
+
+
+class _EchoProvider(StubLLMProvider):
+    """Echoes the prompt back; earlier calls finish later."""
+
+    def __init__(self) -> None:
+        self._delays = iter(range(20, 0, -1))
+
+    async def chat(self, request):
+        response = await super().chat(request)
+        await asyncio.sleep(next(self._delays) / 1000)
+        response.content = request.messages[-1].content
+        return response
+
+
+async def test_orchestrator_run_many_preserves_order():
+    orch = Orchestrator(provider=_EchoProvider())
+    inputs = [f"task number {i}" for i in range(5)]
+    results = await orch.run_many(inputs)
+    assert len(results) == len(inputs)
+    for text, result in zip(inputs, results, strict=True):
+        assert text in result["result"]
+    assert await orch.run_many([]) == []
+
+
+async def test_orchestrator_run_many_bounds_concurrency(monkeypatch):
+    orch = Orchestrator()
+    active = peak = 0
+
+    async def fake_run_async(text):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
+        return {"result": text}
+
+    monkeypatch.setattr(orch, "run_async", fake_run_async)
+    inputs = [str(i) for i in range(10)]
+    results = await orch.run_many(inputs, max_concurrency=3)
+    assert [r["result"] for r in results] == inputs
+    assert peak == 3
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await orch.run_many(inputs, max_concurrency=0)
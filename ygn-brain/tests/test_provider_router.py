@@ -7,7 +7,7 @@ import pytest
 from ygn_brain.provider import (
     StubLLMProvider,
 )
-from ygn_brain.provider_router import ModelSelector, ProviderRouter
+from ygn_brain.provider_router import _ROUTE_CACHE_SIZE, ModelSelector, ProviderRouter
 from ygn_brain.swarm import TaskComplexity
 
 # ---------------------------------------------------------------------------
@@ -112,6 +112,15 @@ def test_route_llama_prefix():
     assert provider.name() == "ollama"
 
 
+def test_route_prefix_skips_unregistered_provider():
+    router = ProviderRouter()
+    router.register(_GeminiStub())
+    router.set_default("gemini")
+    # "o4-mini" prefix-matches codex, which is not registered -> default
+    assert router.route("o4-mini").name() == "gemini"
+    assert router.route("OLLAMA-phi").name() == "gemini"
+
+
 def test_route_explicit_model_map():
     router = ProviderRouter()
     router.register(_ClaudeStub())
@@ -144,6 +153,32 @@ def test_route_unknown_model_no_default_raises():
         router.route("unknown-model")
 
 
+def test_route_cache_invalidated_on_registration_changes():
+    router = ProviderRouter()
+    router.register(StubLLMProvider())
+    router.set_default("stub")
+    assert router.route("gpt-4o").name() == "stub"
+    # Registering a prefix-matching provider must not serve the stale result
+    router.register(_CodexStub())
+    assert router.route("gpt-4o").name() == "codex"
+    router.register(_ClaudeStub())
+    router.map_model("gpt-4o", "claude")
+    assert router.route("gpt-4o").name() == "claude"
+
+
+def test_route_cache_is_bounded_lru():
+    router = ProviderRouter()
+    router.register(StubLLMProvider())
+    router.set_default("stub")
+    router.route("model-0")
+    for i in range(1, _ROUTE_CACHE_SIZE + 50):
+        router.route(f"model-{i}")
+        router.route("model-0")  # kept warm
+    assert len(router._resolved) == _ROUTE_CACHE_SIZE
+    assert "model-0" in router._resolved
+    assert "model-1" not in router._resolved
+
+
 def test_set_default_unknown_provider_raises():
     router = ProviderRouter()
     with pytest.raises(KeyError, match="Unknown provider"):
@@ -203,6 +238,18 @@ def test_selector_preferred_openai():
     assert model.startswith("gpt")
 
 
+def test_selector_preferred_openai_by_complexity():
+    selector = ModelSelector()
+    assert selector.select(TaskComplexity.COMPLEX, preferred_provider="openai") == "gpt-4o"
+    assert selector.select(TaskComplexity.SIMPLE, preferred_provider="openai") == "gpt-4o-mini"
+
+
+def test_selector_preferred_unknown_provider_uses_complexity_map():
+    selector = ModelSelector()
+    model = selector.select(TaskComplexity.MODERATE, preferred_provider="acme")
+    assert model == "gpt-5.2-codex"
+
+
 def test_selector_preferred_gemini():
     selector = ModelSelector()
     model = selector.select(TaskComplexity.SIMPLE, preferred_provider="gemini")
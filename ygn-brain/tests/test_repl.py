@@ -76,6 +76,22 @@ def test_main_help_command(capsys: pytest.CaptureFixture[str]) -> None:
     assert "quit" in captured.out
 
 
+def test_main_reset_command(capsys: pytest.CaptureFixture[str]) -> None:
+    """main() should start a new session on 'reset' without restarting."""
+    with patch("builtins.input", side_effect=["hello world", "reset", "quit"]):
+        main()
+    captured = capsys.readouterr()
+    assert "New session:" in captured.out
+    assert "Bye!" in captured.out
+
+
+def test_main_async_flag_dispatches_to_async_repl() -> None:
+    """main(['--async']) should launch the async REPL."""
+    with patch("ygn_brain.repl.run_async_main") as run_async:
+        main(["--async"])
+    run_async.assert_called_once_with()
+
+
 def test_main_empty_input_is_skipped(capsys: pytest.CaptureFixture[str]) -> None:
     """main() should ignore empty lines."""
     with patch("builtins.input", side_effect=["", "  ", "quit"]):
@@ -128,6 +144,18 @@ async def test_async_main_eof(capsys: pytest.CaptureFixture[str]) -> None:
     assert "Bye!" in captured.out
 
 
+@pytest.mark.asyncio
+async def test_async_main_batch_mode(capsys: pytest.CaptureFixture[str]) -> None:
+    """async_main(lines) should process piped lines in order without input()."""
+    lines = ["first task\n", "\n", "status\n", "second task\n", "quit\n", "ignored\n"]
+    with patch("builtins.input", side_effect=AssertionError("input() must not be used")):
+        await async_main(lines)
+    out = capsys.readouterr().out
+    assert out.count("stub response") == 2
+    assert out.index("FSM state:") < out.rindex("stub response")
+    assert "Bye!" in out
+
+
 # ---------------------------------------------------------------------------
 # _print_result helper
 # ---------------------------------------------------------------------------
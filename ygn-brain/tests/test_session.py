@@ -39,3 +39,21 @@ def test_session_wraps_evidence_pack():
     pack = session.to_evidence_pack()
     assert pack.session_id == session.session_id
     assert len(pack.entries) == 1
+
+
+def test_session_record_many_matches_record():
+    session = Session()
+    session.record("tool_call", {"tool_name": "echo"}, token_estimate=10)
+    events = session.record_many(
+        [
+            ("artifact_stored", {"handle": "a1"}, 10),
+            ("tool_success", {"tool_name": "echo"}, 5),
+        ]
+    )
+    assert [e.kind for e in events] == ["artifact_stored", "tool_success"]
+    assert session.event_log.events[1:] == events
+    assert session.event_log.total_tokens() == 25
+    assert len({e.event_id for e in session.event_log.events}) == 3
+    assert [e.kind.value for e in session.evidence.entries] == ["tool_call", "output", "output"]
+    assert session.evidence.verify()
+    assert session.record_many([]) == []
@@ -1,6 +1,9 @@
 """Tests for success memory — record, query, best_mode_for, success_rate."""
 
+import threading
+
 from ygn_brain.success_memory import SuccessMemory
+from ygn_brain.swarm import SwarmMode, TaskComplexity
 
 
 def test_record_and_query():
@@ -107,3 +110,116 @@ def test_clear():
     count = mem.clear()
     assert count == 2
     assert mem.query() == []
+
+
+def test_indexes_combine_domain_and_complexity():
+    """Domain and complexity filters intersect via the secondary indexes."""
+    mem = SuccessMemory()
+    mem.record("a", "sequential", ["code", "math"], "simple", "success", 0.5)
+    mem.record("b", "parallel", ["math"], "complex", "failure", 0.6)
+    mem.record("c", "specialist", ["research"], "simple", "success", 0.7)
+
+    results = mem.query(domains=["math", "research"], complexity="simple")
+    assert [r.task_description for r in results] == ["c", "a"]
+    assert mem.query(domains=["unknown"]) == []
+
+
+def test_clear_resets_indexes():
+    """Indexes and per-mode aggregates are reset by clear()."""
+    mem = SuccessMemory()
+    mem.record("t1", "parallel", ["code"], "simple", "success", 0.8)
+    mem.clear()
+    assert mem.success_rate("parallel") == 0.0
+    assert mem.query(domains=["code"]) == []
+    mem.record("t2", "sequential", ["code"], "simple", "failure", 0.4)
+    assert [r.task_description for r in mem.query(domains=["code"])] == ["t2"]
+
+
+def test_best_mode_for_ignores_other_complexities():
+    """Records with a different complexity do not influence best_mode_for."""
+    mem = SuccessMemory()
+    mem.record("t1", "parallel", ["code"], "simple", "success", 0.9)
+    mem.record("t2", "parallel", ["code"], "complex", "failure", 0.2)
+    mem.record("t3", "specialist", ["code"], "complex", "success", 0.6)
+
+    assert mem.best_mode_for(["code"], "complex") == "specialist"
+    assert mem.best_mode_for(["code"], "simple") == "parallel"
+
+
+def test_best_mode_for_breaks_ties_by_first_record():
+    """Equal rates go to the mode whose best record ranks first by confidence."""
+    mem = SuccessMemory()
+    mem.record("t1", "sequential", ["code"], "complex", "success", 0.5)
+    mem.record("t2", "specialist", ["code"], "complex", "success", 0.9)
+    assert mem.best_mode_for(["code"], "complex") == "specialist"
+
+    mem = SuccessMemory()
+    mem.record("t1", "specialist", ["code"], "complex", "failure", 0.4)
+    mem.record("t2", "parallel", ["code"], "complex", "failure", 0.4)
+    mem.record("t3", "sequential", ["code"], "complex", "failure", 0.4)
+    assert mem.best_mode_for(["code"], "complex") == "specialist"
+
+
+def test_query_limit_keeps_highest_confidence():
+    """A small limit returns the top records without a full sort."""
+    mem = SuccessMemory()
+    for i, conf in enumerate([0.2, 0.9, 0.5, 0.7, 0.1]):
+        mem.record(f"t{i}", "parallel", ["code"], "simple", "success", conf)
+
+    top = mem.query(limit=2)
+    assert [r.confidence for r in top] == [0.9, 0.7]
+    assert mem.query(limit=0) == []
+
+
+def test_record_coerces_enums():
+    """Mode and complexity strings are stored as enum members."""
+    mem = SuccessMemory()
+    rec = mem.record("t", "parallel", ["code"], "simple", "success", 0.5)
+    assert rec.swarm_mode is SwarmMode.PARALLEL
+    assert rec.complexity is TaskComplexity.SIMPLE
+    assert mem.best_mode_for(["code"], TaskComplexity.SIMPLE) is SwarmMode.PARALLEL
+
+
+def test_record_keeps_unknown_mode_and_complexity_strings():
+    """Values that name no enum member are stored and queried as given."""
+    mem = SuccessMemory()
+    rec = mem.record("t", "custom_mode", ["code"], "unusual", "success", 0.5)
+    assert rec.swarm_mode == "custom_mode"
+    assert rec.complexity == "unusual"
+    mem.record("t", "parallel", ["code"], "unusual", "failure", 0.9)
+
+    assert mem.best_mode_for(["code"], "unusual") == "custom_mode"
+    assert mem.query(complexity="unusual", limit=5)[1] is rec
+    assert mem.success_rate("custom_mode") == 1.0
+
+    mem.clear()
+    mem.record("t", "other_mode", ["code"], "simple", "success", 0.5)
+    assert mem.best_mode_for(["code"], "simple") == "other_mode"
+
+
+def test_record_ids_are_unique_hex():
+    """Record ids are 32 hex chars and unique."""
+    mem = SuccessMemory()
+    ids = {mem.record("t", "parallel", [], "simple", "success", 0.1).record_id for _ in range(2500)}
+    assert len(ids) == 2500
+    assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+
+
+def test_concurrent_record_keeps_indexes_consistent():
+    """Concurrent writers never interleave record/index updates."""
+    mem = SuccessMemory()
+
+    def writer(mode: str) -> None:
+        for i in range(500):
+            mem.record(f"{mode}-{i}", mode, ["code"], "simple", "success", i / 500)
+
+    threads = [threading.Thread(target=writer, args=(m,)) for m in ("parallel", "sequential")]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(mem.query(domains=["code"], limit=2000)) == 1000
+    assert mem.success_rate("parallel") == 1.0
+    for rec in mem.query(limit=2000):
+        assert rec.task_description.startswith(rec.swarm_mode.value)
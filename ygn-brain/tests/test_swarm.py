@@ -1,10 +1,17 @@
 """Tests for swarm module — hybrid swarm engine."""
 
 from ygn_brain.swarm import (
+    _DOMAIN_KEYWORD_TABLE,
+    _DOMAIN_KEYWORDS,
     SwarmEngine,
+    SwarmExecutor,
     SwarmMode,
+    SwarmResult,
+    TaskAnalysis,
     TaskAnalyzer,
     TaskComplexity,
+    _count_words,
+    _detect_domains,
 )
 
 
@@ -52,3 +59,108 @@ def test_engine_analyze_returns_task_analysis():
     analysis = engine.analyze("Write a short essay about cats")
     assert analysis.complexity in TaskComplexity
     assert len(analysis.domains) >= 1
+
+
+def test_analyze_is_memoized_for_repeated_input():
+    analyzer = TaskAnalyzer()
+    first = analyzer.analyze("Write a short essay about cats")
+    second = TaskAnalyzer().analyze("Write a short essay about cats")
+    assert first is second
+    assert isinstance(first.domains, tuple)
+
+
+def test_task_analysis_stores_domains_as_tuple():
+    """Domains given as a list are kept hashable, like analyzer results."""
+    analysis = TaskAnalysis(
+        complexity=TaskComplexity.SIMPLE,
+        domains=["code", "data"],
+        suggested_mode=SwarmMode.SEQUENTIAL,
+    )
+    assert analysis.domains == ("code", "data")
+    assert hash(analysis) == hash(
+        TaskAnalysis(TaskComplexity.SIMPLE, ("code", "data"), SwarmMode.SEQUENTIAL)
+    )
+
+
+def test_analyzer_subclass_bypasses_cache():
+    class AlwaysExpert(TaskAnalyzer):
+        def _assess_complexity(self, text, word_count, domains):
+            return TaskComplexity.EXPERT
+
+    analysis = AlwaysExpert().analyze("hello")
+    assert analysis.complexity == TaskComplexity.EXPERT
+    assert analysis.suggested_mode == SwarmMode.SPECIALIST
+    assert TaskAnalyzer().analyze("hello").complexity == TaskComplexity.TRIVIAL
+
+
+def test_engines_share_default_executors():
+    first, second = SwarmEngine(), SwarmEngine()
+    assert first._executors is second._executors
+
+
+def test_override_does_not_leak_into_other_engines():
+    class EchoExecutor(SwarmExecutor):
+        def execute(self, context):
+            return SwarmResult(mode=SwarmMode.SEQUENTIAL, output="echo")
+
+    engine = SwarmEngine()
+    engine.override(SwarmMode.SEQUENTIAL, EchoExecutor())
+    assert engine.run("hi").output == "echo"
+    assert SwarmEngine().run("hi").output == "[sequential] Processed: hi"
+
+
+def test_value_objects_use_slots():
+    result = SwarmResult(mode=SwarmMode.SEQUENTIAL, output="x")
+    assert not hasattr(result, "__dict__")
+    assert not hasattr(TaskAnalyzer().analyze("hello"), "__dict__")
+
+
+def test_count_words_matches_split():
+    samples = ["", " ", "hello", "a b c", "  a  b ", "a\tb\nc", "x y z", "one two  three"]
+    for text in samples:
+        assert _count_words(text) == len(text.split()), text
+
+
+def test_detect_domains_matches_substring_semantics():
+    texts = ["hello", "build a ui for the sql database", "prove the theorem, then draft an essay"]
+    for text in texts:
+        expected = [d for d, kws in _DOMAIN_KEYWORDS.items() if any(kw in text for kw in kws)]
+        assert _detect_domains(text) == expected
+
+
+def test_domain_keyword_table_drops_redundant_keywords():
+    data_keywords = dict(_DOMAIN_KEYWORD_TABLE)["data"]
+    assert "data" in data_keywords
+    assert "dataset" not in data_keywords
+    assert _detect_domains("load the dataset") == ["data"]
+
+
+def test_analysis_cache_is_shared_between_run_and_analyze():
+    TaskAnalyzer.clear_cache()
+    engine = SwarmEngine()
+    engine.analyze("Write a short essay about dogs")
+    engine.run("Write a short essay about dogs")
+    info = TaskAnalyzer.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+
+
+def test_trivial_input_keeps_detected_domains():
+    result = TaskAnalyzer().analyze("write code")
+    assert result.complexity == TaskComplexity.TRIVIAL
+    assert result.suggested_mode == SwarmMode.SEQUENTIAL
+    assert result.domains == ("code", "writing")
+
+
+def test_suggest_mode_covers_every_complexity():
+    analyzer = TaskAnalyzer()
+    expected = {
+        TaskComplexity.TRIVIAL: SwarmMode.SEQUENTIAL,
+        TaskComplexity.SIMPLE: SwarmMode.SEQUENTIAL,
+        TaskComplexity.MODERATE: SwarmMode.LEAD_SUPPORT,
+        TaskComplexity.EXPERT: SwarmMode.SPECIALIST,
+    }
+    for complexity, mode in expected.items():
+        assert analyzer._suggest_mode(complexity, ["code", "data"]) == mode
+    assert analyzer._suggest_mode(TaskComplexity.COMPLEX, ["code", "data"]) == SwarmMode.PARALLEL
+    assert analyzer._suggest_mode(TaskComplexity.COMPLEX, ["code"]) == SwarmMode.RED_BLUE
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from ygn_brain.swarm import SwarmMode, TaskAnalysis, TaskComplexity
 from ygn_brain.teaming import (
     AgentProfile,
@@ -75,7 +77,15 @@ def test_team_builder_forms_team() -> None:
     builder = TeamBuilder(_make_agents())
     team = builder.form_team(_task_analysis())
     assert len(team.agents) > 0
-    assert team.team_id
+    assert len(team.team_id) == 12
+    int(team.team_id, 16)
+
+
+def test_team_value_objects_use_slots() -> None:
+    """AgentProfile and TeamFormation carry no per-instance __dict__."""
+    team = TeamBuilder(_make_agents()).form_team(_task_analysis())
+    assert not hasattr(team, "__dict__")
+    assert not hasattr(team.agents[0], "__dict__")
 
 
 def test_team_builder_assigns_lead_by_trust() -> None:
@@ -105,6 +115,34 @@ def test_team_builder_limits_team_size() -> None:
     assert len(team.agents) <= 2
 
 
+def test_team_builder_ranks_by_score_then_trust() -> None:
+    """Selection order: domain matches, then trust; equal pairs keep pool order."""
+    agents = _make_agents()
+    twin = AgentProfile(
+        agent_id="agent-twin",
+        node_id="node-5",
+        role="executor",
+        capabilities=["code", "data"],
+        trust_level=0.8,
+        is_local=True,
+    )
+    builder = TeamBuilder([*agents, twin])
+    team = builder.form_team(_task_analysis(domains=["code", "data"]), max_size=3)
+    assert [a.agent_id for a in team.agents] == [
+        "agent-executor",
+        "agent-twin",
+        "agent-specialist",
+    ]
+
+
+def test_team_builder_set_available_agents_reindexes() -> None:
+    """Replacing the pool makes form_team score against the new agents."""
+    builder = TeamBuilder(_make_agents()[:1])
+    builder.set_available_agents(_make_agents())
+    team = builder.form_team(_task_analysis(domains=["math"]), max_size=1)
+    assert [a.agent_id for a in team.agents] == ["agent-validator"]
+
+
 # ---------------------------------------------------------------------------
 # FlowController tests
 # ---------------------------------------------------------------------------
@@ -140,6 +178,24 @@ def test_flow_controller_lead_first() -> None:
     assert first.agent_id == max(agents, key=lambda a: a.trust_level).agent_id
 
 
+def test_flow_controller_lead_first_cycles_by_trust() -> None:
+    """Later turns cycle through the agents in descending trust order."""
+    agents = list(reversed(_make_agents()))
+    ctrl = FlowController(FlowPolicy.LEAD_FIRST, agents)
+    conversation: list[dict[str, object]] = []
+    order = []
+    for _ in range(5):
+        conversation.append({"agent_id": "x", "content": ""})
+        order.append(ctrl.next_speaker(conversation).agent_id)  # type: ignore[arg-type]
+    assert order == [
+        "agent-planner",
+        "agent-executor",
+        "agent-validator",
+        "agent-specialist",
+        "agent-planner",
+    ]
+
+
 def test_flow_controller_capability_match() -> None:
     """Capability-match picks the agent whose capabilities appear in conversation."""
     agents = _make_agents()
@@ -152,6 +208,72 @@ def test_flow_controller_capability_match() -> None:
     assert speaker.agent_id == "agent-specialist"
 
 
+def test_flow_controller_capability_match_tracks_new_turns() -> None:
+    """Words from appended turns count; a fresh conversation starts over."""
+    ctrl = FlowController(FlowPolicy.CAPABILITY_MATCH, _make_agents())
+    conversation: list[dict[str, object]] = [{"agent_id": "x", "content": "Check the MATH"}]
+    assert ctrl.next_speaker(conversation).agent_id == "agent-validator"  # type: ignore[arg-type]
+
+    conversation.append({"agent_id": "y", "content": "then some code and data work"})
+    assert ctrl.next_speaker(conversation).agent_id == "agent-executor"  # type: ignore[arg-type]
+
+    fresh: list[dict[str, object]] = [{"agent_id": "z", "content": "design review"}]
+    assert ctrl.next_speaker(fresh).agent_id == "agent-specialist"  # type: ignore[arg-type]
+
+
+def test_flow_controller_capability_match_notices_reused_list() -> None:
+    """Clearing and refilling, or editing the last turn, is not served stale."""
+    ctrl = FlowController(FlowPolicy.CAPABILITY_MATCH, _make_agents())
+    conversation: list[dict[str, object]] = [{"agent_id": "x", "content": "Check the MATH"}]
+    assert ctrl.next_speaker(conversation).agent_id == "agent-validator"  # type: ignore[arg-type]
+
+    conversation.clear()
+    conversation.append({"agent_id": "y", "content": "code and data work"})
+    assert ctrl.next_speaker(conversation).agent_id == "agent-executor"  # type: ignore[arg-type]
+
+    conversation[0]["content"] = "design review"
+    assert ctrl.next_speaker(conversation).agent_id == "agent-specialist"  # type: ignore[arg-type]
+
+    conversation[0] = {"agent_id": "z", "content": "Check the MATH"}
+    assert ctrl.next_speaker(conversation).agent_id == "agent-validator"  # type: ignore[arg-type]
+
+
+def test_flow_controller_capability_match_counts_duplicate_capabilities() -> None:
+    """A capability listed twice scores twice, as in TeamBuilder."""
+    agents = [
+        AgentProfile(
+            agent_id="agent-broad",
+            node_id="node-1",
+            role="planner",
+            capabilities=["code", "data"],
+            trust_level=0.9,
+            is_local=True,
+        ),
+        AgentProfile(
+            agent_id="agent-deep",
+            node_id="node-2",
+            role="executor",
+            capabilities=["code", "CODE", "code"],
+            trust_level=0.5,
+            is_local=True,
+        ),
+    ]
+    ctrl = FlowController(FlowPolicy.CAPABILITY_MATCH, agents)
+    conversation: list[dict[str, object]] = [{"agent_id": "x", "content": "code and data"}]
+    assert ctrl.next_speaker(conversation).agent_id == "agent-deep"  # type: ignore[arg-type]
+
+
+def test_flow_controller_debate_alternates_roles() -> None:
+    """Debate picks the first agent whose role differs from the last speaker's."""
+    agents = _make_agents()
+    ctrl = FlowController(FlowPolicy.DEBATE, agents)
+    assert ctrl.next_speaker([]).agent_id == "agent-planner"
+    after_planner = [{"agent_id": "agent-planner", "content": ""}]
+    assert ctrl.next_speaker(after_planner).agent_id == "agent-executor"  # type: ignore[arg-type]
+    after_unknown = [{"agent_id": "nobody", "content": ""}]
+    assert ctrl.next_speaker(after_unknown).agent_id == "agent-planner"  # type: ignore[arg-type]
+
+
 def test_flow_controller_should_conclude_after_max_rounds() -> None:
     """should_conclude returns True when enough rounds have elapsed."""
     agents = _make_agents()[:2]
@@ -180,6 +302,40 @@ def test_distributed_swarm_engine_end_to_end() -> None:
     assert result.metadata["team_id"]
 
 
+def test_distributed_swarm_engine_runs_max_rounds_per_agent() -> None:
+    """The stock controller yields exactly five rounds per team member."""
+    agents = _make_agents()
+    engine = DistributedSwarmEngine(TeamBuilder(agents), FlowController)
+    result = engine.run_distributed("Write code and research the topic", agents)
+    assert result.metadata["conversation_turns"] == 5 * len(result.metadata["agents"])
+
+
+def test_strategy_to_policy_accepts_mode_or_name() -> None:
+    to_policy = DistributedSwarmEngine._strategy_to_policy
+    assert to_policy(SwarmMode.SPECIALIST) == FlowPolicy.CAPABILITY_MATCH
+    assert to_policy("lead_support") == FlowPolicy.LEAD_FIRST
+    assert to_policy("unknown") == FlowPolicy.ROUND_ROBIN
+
+
+def test_resolve_mode_falls_back_to_sequential() -> None:
+    assert DistributedSwarmEngine._resolve_mode("parallel") is SwarmMode.PARALLEL
+    assert DistributedSwarmEngine._resolve_mode("unknown") is SwarmMode.SEQUENTIAL
+
+
+class _ShortController(FlowController):
+    """Custom terminator: stop after a single turn."""
+
+    def should_conclude(self, conversation: list[dict[str, Any]], max_rounds: int = 5) -> bool:
+        return len(conversation) >= 1
+
+
+def test_distributed_swarm_engine_honours_custom_should_conclude() -> None:
+    agents = _make_agents()
+    engine = DistributedSwarmEngine(TeamBuilder(agents), _ShortController)
+    result = engine.run_distributed("Write code and research the topic", agents)
+    assert result.metadata["conversation_turns"] == 1
+
+
 # ---------------------------------------------------------------------------
 # Team dissolve
 # ---------------------------------------------------------------------------
@@ -2,6 +2,16 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import grpc
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import INVALID_SPAN
+
 from ygn_brain.telemetry import (
     TelemetryConfig,
     YgnTracer,
@@ -19,6 +29,16 @@ def test_init_with_none_config_succeeds() -> None:
     tracer.shutdown()
 
 
+def test_disabled_telemetry_does_not_load_the_sdk() -> None:
+    code = (
+        "import sys\n"
+        "from ygn_brain.telemetry import TelemetryConfig, YgnTracer\n"
+        "YgnTracer(TelemetryConfig(exporter='none')).init()\n"
+        "assert not [m for m in sys.modules if m.startswith('opentelemetry.sdk')]\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)  # noqa: S603
+
+
 def test_span_context_manager_works() -> None:
     config = TelemetryConfig(exporter="none")
     tracer = YgnTracer(config)
@@ -28,6 +48,29 @@ def test_span_context_manager_works() -> None:
     tracer.shutdown()
 
 
+def test_disabled_tracer_skips_span_creation() -> None:
+    tracer = YgnTracer(TelemetryConfig(exporter="none"))
+    tracer.init()
+    first = tracer.span("a", {"key": "value"})
+    assert first is tracer.span("b")
+    with first as s, trace_mcp_call("echo") as inner:
+        assert s is INVALID_SPAN
+        assert inner is INVALID_SPAN
+
+
+def test_span_records_attributes() -> None:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = YgnTracer()
+    tracer._tracer = provider.get_tracer("test")
+    with tracer.span("test-span", {"key": "value", "other": "x"}):
+        pass
+    (span,) = exporter.get_finished_spans()
+    assert dict(span.attributes or {}) == {"key": "value", "other": "x"}
+    provider.shutdown()
+
+
 def test_record_event_does_not_error() -> None:
     config = TelemetryConfig(exporter="none")
     tracer = YgnTracer(config)
@@ -36,6 +79,24 @@ def test_record_event_does_not_error() -> None:
     tracer.shutdown()
 
 
+def test_record_event_on_targets_the_given_span() -> None:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = YgnTracer()
+    tracer._tracer = provider.get_tracer("test")
+    with tracer.span("outer") as outer:
+        with tracer.span("inner"):
+            tracer.record_event_on(outer, "chunk", {"n": "1"})
+            tracer.record_event("here")
+    inner, finished_outer = exporter.get_finished_spans()
+    assert [e.name for e in finished_outer.events] == ["chunk"]
+    assert dict(finished_outer.events[0].attributes or {}) == {"n": "1"}
+    assert [e.name for e in inner.events] == ["here"]
+    YgnTracer.record_event_on(INVALID_SPAN, "ignored")
+    provider.shutdown()
+
+
 def test_convenience_functions_do_not_error() -> None:
     with trace_orchestrator_run("session-1") as s:
         assert s is not None
@@ -55,6 +116,35 @@ def test_config_defaults_are_correct() -> None:
     assert config.otlp_endpoint == "http://localhost:4317"
 
 
+def test_otlp_exporter_uses_configured_batch_processor() -> None:
+    config = TelemetryConfig(exporter="otlp", max_queue_size=128, max_export_batch_size=16)
+    tracer = YgnTracer(config)
+    tracer.init()
+    assert tracer._provider is not None
+    (processor,) = tracer._provider._active_span_processor._span_processors
+    assert isinstance(processor, BatchSpanProcessor)
+    assert processor._batch_processor._max_queue_size == 128
+    assert processor._batch_processor._max_export_batch_size == 16
+    tracer.shutdown()
+
+
+def test_otlp_exporter_uses_compression_and_channel_options() -> None:
+    tracer = YgnTracer(TelemetryConfig(exporter="otlp", compression="deflate"))
+    tracer.init()
+    assert tracer._provider is not None
+    (processor,) = tracer._provider._active_span_processor._span_processors
+    exporter = processor._batch_processor._exporter
+    assert exporter._compression == grpc.Compression.Deflate
+    assert ("grpc.keepalive_time_ms", 30000) in exporter._channel_options
+    tracer.shutdown()
+
+
+def test_unknown_otlp_compression_is_rejected() -> None:
+    tracer = YgnTracer(TelemetryConfig(exporter="otlp", compression="brotli"))
+    with pytest.raises(ValueError, match="brotli"):
+        tracer.init()
+
+
 def test_shutdown_is_safe_to_call_multiple_times() -> None:
     config = TelemetryConfig(exporter="none")
     tracer = YgnTracer(config)
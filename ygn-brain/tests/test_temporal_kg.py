@@ -81,3 +81,31 @@ def test_relation_index_updated():
     mem.store("k1", "def process_data", MemoryCategory.CORE, "s1", tier=MemoryTier.COLD)
     assert "process_data" in mem._relation_index
     assert "k1" in mem._relation_index["process_data"]
+
+
+def test_recall_multihop_expands_each_entity_once():
+    mem = TieredMemoryService(entity_extractor=RegexEntityExtractor())
+    # A cycle: alpha -> beta -> gamma -> alpha
+    mem.store("k1", "def alpha calls def beta", MemoryCategory.CORE, tier=MemoryTier.COLD)
+    mem.store("k2", "def beta calls def gamma", MemoryCategory.CORE, tier=MemoryTier.COLD)
+    mem.store("k3", "def gamma calls def alpha", MemoryCategory.CORE, tier=MemoryTier.COLD)
+
+    lookups: list[str] = []
+
+    class _CountingIndex(dict):
+        def get(self, entity, default=None):
+            lookups.append(entity)
+            return super().get(entity, default)
+
+    mem._relation_index = _CountingIndex(mem._relation_index)
+    keys = {r.key for r in mem.recall_multihop("alpha", hops=10)}
+    assert keys == {"k1", "k2", "k3"}
+    assert sorted(lookups) == ["alpha", "beta", "gamma"]
+
+
+def test_relation_lookups_do_not_grow_the_index():
+    mem = TieredMemoryService(entity_extractor=RegexEntityExtractor())
+    mem.store("k1", "def alpha", MemoryCategory.CORE, tier=MemoryTier.COLD)
+    assert mem.recall_by_relation("missing") == []
+    assert mem.recall_multihop("also_missing") == []
+    assert set(mem._relation_index) == {"alpha"}
@@ -2,8 +2,13 @@
 
 import time
 
-from ygn_brain.memory import MemoryCategory
-from ygn_brain.tiered_memory import MemoryTier, TieredMemoryService
+from ygn_brain.memory import MemoryCategory, MemoryEntry
+from ygn_brain.tiered_memory import (
+    _HEAP_COMPACT_MIN,
+    MemoryTier,
+    TieredMemoryService,
+    WarmEntry,
+)
 
 
 def test_hot_tier_storage_and_ttl_expiry():
@@ -171,3 +176,252 @@ def test_session_filtering_across_tiers():
     results = mem.recall("data", session_id="s1", limit=10)
     assert len(results) == 1
     assert results[0].session_id == "s1"
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def test_hot_expiry_heap_tracks_restored_keys(monkeypatch):
+    """Re-storing a hot key restarts its TTL; decay evicts only what expired."""
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService(hot_ttl_seconds=10.0)
+    mem.store("a", "alpha note", MemoryCategory.CONVERSATION)
+    mem.store("b", "beta note", MemoryCategory.CONVERSATION)
+
+    clock.now += 6
+    mem.store("a", "alpha note", MemoryCategory.CONVERSATION)  # now expires at +16
+
+    clock.now += 6  # +12: b expired, a still live
+    assert [e.key for e in mem.recall("note", limit=10)] == ["a"]
+
+    clock.now += 5  # +17: a expired too
+    assert mem.decay() == (1, 0)
+    assert mem.recall("note", limit=10) == []
+
+
+def test_tag_and_session_index_follow_tier_changes(monkeypatch):
+    """Filtered warm/cold recall stays correct across overwrite, promote and forget."""
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService()
+    caller_tags = ["infra"]
+    mem.store("w1", "note one", MemoryCategory.CORE, "s1", tags=caller_tags, tier=MemoryTier.WARM)
+    mem.store("w2", "note two", MemoryCategory.CORE, "s2", tags=["infra"], tier=MemoryTier.WARM)
+    mem.store("w3", "note three", MemoryCategory.CORE, "s1", tags=["ops"], tier=MemoryTier.WARM)
+    caller_tags.clear()  # callers mutating their list must not corrupt the index
+
+    def keys(**kwargs):
+        return [e.key for e in mem.recall("note", limit=10, **kwargs)]
+
+    # Equal timestamps: results keep tier order, as a full scan would.
+    assert keys(tags=["infra", "ops"]) == ["w1", "w2", "w3"]
+    assert keys(session_id="s1", tags=["infra"]) == ["w1"]
+
+    # Overwrite moves w1 out of "infra" but keeps its slot.
+    mem.store("w1", "note one", MemoryCategory.CORE, "s2", tags=["ops"], tier=MemoryTier.WARM)
+    assert keys(tags=["infra"]) == ["w2"]
+    assert keys(tags=["ops"]) == ["w1", "w3"]
+    assert keys(session_id="s1") == ["w3"]
+
+    mem.promote("w2", MemoryTier.COLD)
+    assert keys(tags=["infra"], tier=MemoryTier.WARM) == []
+    assert keys(tags=["infra"], tier=MemoryTier.COLD) == ["w2"]
+
+    mem.forget("w3")
+    assert keys(session_id="s1") == []
+    assert keys(tags=["unknown"]) == []
+
+
+def test_keyword_index_keeps_substring_semantics():
+    """Indexed warm/cold recall matches the same substrings a full scan would."""
+    mem = TieredMemoryService()
+    mem.store("arch-1", "Microservices Architecture", MemoryCategory.CORE, tier=MemoryTier.WARM)
+    mem.store("db-1", "postgres tuning", MemoryCategory.CORE, tier=MemoryTier.COLD)
+    mem.store("db-2", "redis cache", MemoryCategory.CORE, tier=MemoryTier.COLD)
+
+    def keys(query, **kwargs):
+        return sorted(e.key for e in mem.recall(query, limit=10, **kwargs))
+
+    assert keys("micro") == ["arch-1"]  # partial word
+    assert keys("TECTURE") == ["arch-1"]  # case-insensitive, mid-word
+    assert keys("db-") == ["db-1", "db-2"]  # matches the key too
+    assert keys("tuning cache") == ["db-1", "db-2"]  # any word may match
+    assert keys("ostgres redis", tier=MemoryTier.COLD) == ["db-1", "db-2"]
+    assert keys("missing") == []
+
+    # Overwrite and forget drop stale postings.
+    mem.store("db-1", "mysql tuning", MemoryCategory.CORE, tier=MemoryTier.COLD)
+    assert keys("postgres") == []
+    assert keys("mysql") == ["db-1"]
+    mem.forget("db-1")
+    assert keys("tuning") == []
+
+
+def test_keyword_index_posts_word_tokens():
+    """Large entries cost one posting per distinct token, and still match substrings."""
+    mem = TieredMemoryService()
+    index = mem._warm_index
+    mem.store("small", "redis cache", MemoryCategory.CORE, tier=MemoryTier.WARM)
+    assert set(index.by_token) == {"small", "redis", "cache"}
+
+    words = " ".join(f"w{i:05d}" for i in range(5000))
+    big = f"{words} {words} needle-at-the-end"
+    mem.store("big", big, MemoryCategory.CORE, tier=MemoryTier.WARM)
+    assert len(index.by_token) == 3 + 5000 + 2  # distinct tokens, incl. "big"
+
+    def keys(query):
+        return sorted(e.key for e in mem.recall(query, limit=10))
+
+    assert keys("needle-at-the-end") == ["big"]
+    assert keys("at-the") == ["big"]  # partial word
+    assert keys("redis") == ["small"]
+    assert keys("04999") == ["big"]
+    assert keys("x" * 100) == []
+
+    mem.store("big", "now short", MemoryCategory.CORE, tier=MemoryTier.WARM)
+    assert keys("needle") == []
+    mem.forget("big")
+    assert set(index.by_token) == {"small", "redis", "cache"}
+
+
+def test_hot_expiry_heap_stays_bounded_under_restores(monkeypatch):
+    """Re-storing one key across many TTLs does not accumulate heap records."""
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService(hot_ttl_seconds=10.0)
+    for step in range(3000):  # 30 s, one store every 10 ms, decay every second
+        clock.now += 0.01
+        mem.store("k", "refreshed", MemoryCategory.CONVERSATION)
+        if step % 100 == 99:
+            assert mem.decay() == (0, 0)
+        assert len(mem._hot_expiry) <= 2 * _HEAP_COMPACT_MIN
+    assert list(mem._hot) == ["k"]
+
+    clock.now += 10
+    assert mem.decay() == (1, 0)
+
+
+def test_warm_expiry_heap_stays_bounded_under_restores(monkeypatch):
+    """Warm re-stores and bulk loads leave one record per live entry at most."""
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService(warm_max_age_seconds=10.0)
+    for step in range(3000):
+        clock.now += 0.01
+        mem.store("k", "refreshed", MemoryCategory.CORE, tier=MemoryTier.WARM)
+        if step % 100 == 99:
+            assert mem.decay() == (0, 0)
+        assert len(mem._warm_expiry) <= 2 * _HEAP_COMPACT_MIN
+    assert list(mem._warm) == ["k"]
+
+    restored = [
+        MemoryEntry(key=f"r{i}", content="old", category=MemoryCategory.CORE, timestamp=clock.now)
+        for i in range(3)
+    ]
+    mem.bulk_load(restored * 2, tier=MemoryTier.WARM)
+    assert len(mem._warm_expiry) == len(mem._warm) == 4
+
+    clock.now += 10
+    assert mem.decay() == (0, 4)
+    assert mem._warm_expiry == []
+
+
+def test_tier_entries_are_slotted():
+    mem = TieredMemoryService()
+    for tier in MemoryTier:
+        mem.store(f"k-{tier}", "compact", MemoryCategory.CORE, tier=tier)
+    entries = [*mem._hot.values(), *mem._warm.values(), *mem._cold.values()]
+    assert len(entries) == 3
+    assert not any(hasattr(entry, "__dict__") for entry in entries)
+
+
+def test_entry_search_text_is_derived_at_construction():
+    entry = WarmEntry(
+        key="K1", content="Mixed Case", category=MemoryCategory.CORE, session_id=None, timestamp=1.0
+    )
+    assert entry._search_text == "k1 mixed case"
+    assert "_search_text" not in repr(entry)
+    assert entry == WarmEntry(
+        key="K1", content="Mixed Case", category=MemoryCategory.CORE, session_id=None, timestamp=1.0
+    )
+
+
+def test_recall_limit_keeps_most_recent(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService()
+    for i, tier in enumerate([MemoryTier.COLD, MemoryTier.WARM, MemoryTier.COLD, MemoryTier.WARM]):
+        clock.now += 1
+        mem.store(f"k{i}", "shared note", MemoryCategory.CORE, tier=tier)
+    assert [e.key for e in mem.recall("note", limit=2)] == ["k3", "k2"]
+    assert [e.key for e in mem.recall("note", limit=0)] == []
+
+
+def test_decay_promotes_warm_entries_by_deadline(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService(hot_ttl_seconds=5.0, warm_max_age_seconds=10.0)
+    assert mem.next_decay_at() is None
+
+    mem.store("w1", "first", MemoryCategory.CORE, tier=MemoryTier.WARM)
+    mem.store("w2", "second", MemoryCategory.CORE, tier=MemoryTier.WARM)
+    clock.now += 4
+    mem.store("w1", "first again", MemoryCategory.CORE, tier=MemoryTier.WARM)  # due at +14
+    mem.store("h", "hot", MemoryCategory.CORE)  # expires at +9
+    assert mem.next_decay_at() == clock.now + 5
+
+    clock.now += 7  # +11: only w2 has aged
+    assert mem.decay() == (1, 1)
+    assert list(mem._warm) == ["w1"]
+    assert list(mem._cold) == ["w2"]
+
+    clock.now += 3  # +14: w1's restored deadline
+    assert mem.decay() == (0, 1)
+    assert list(mem._cold) == ["w2", "w1"]
+    assert mem.decay() == (0, 0)
+    assert mem._warm_expiry == []
+
+
+def test_session_ids_are_shared_across_entries():
+    mem = TieredMemoryService()
+    mem.store("a", "x", MemoryCategory.CORE, "".join(["sess", "-1"]))
+    mem.store("b", "y", MemoryCategory.CORE, "".join(["sess", "-1"]), tier=MemoryTier.COLD)
+    assert mem._hot["a"].session_id is mem._cold["b"].session_id
+
+
+def test_bulk_load_restores_entries_with_their_timestamps(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr("ygn_brain.tiered_memory.time", clock)
+    mem = TieredMemoryService(hot_ttl_seconds=5.0, warm_max_age_seconds=10.0)
+    snapshot = [
+        MemoryEntry(
+            key="old",
+            content="archived note",
+            category=MemoryCategory.CORE,
+            timestamp=clock.now - 20,
+            session_id="s1",
+        ),
+        MemoryEntry(
+            key="new", content="recent note", category=MemoryCategory.CORE, timestamp=clock.now - 1
+        ),
+    ]
+    assert mem.bulk_load(iter(snapshot), tags=["restored"], tier=MemoryTier.WARM) == 2
+    assert mem.bulk_load([], tier=MemoryTier.HOT) == 0
+
+    results = mem.recall("note", limit=10, tags=["restored"])
+    assert [(e.key, e.timestamp) for e in results] == [
+        ("new", clock.now - 1),
+        ("old", clock.now - 20),
+    ]
+    assert results[1].session_id == "s1"
+    assert mem.decay() == (0, 1)  # "old" is already past its warm age
+    assert list(mem._cold) == ["old"]
+
+    assert mem.bulk_load(snapshot, tier=MemoryTier.HOT) == 2
+    assert mem.next_decay_at() == clock.now + 5
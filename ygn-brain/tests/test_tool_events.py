@@ -37,3 +37,13 @@ def test_tool_event_error():
     assert evt.kind == ToolEventKind.ERROR
     assert evt.result is None
     assert evt.error == "Connection refused"
+
+
+def test_tool_event_id_encodes_its_timestamp():
+    evt = ToolEvent.create(kind=ToolEventKind.CALL, tool_name="echo")
+    prefix, suffix = evt.event_id.split("-")
+    assert int(prefix, 16) == int(evt.timestamp * 1000)
+    assert len(prefix) == 12
+    assert len(suffix) == 12
+    int(suffix, 16)  # hex
+    assert ToolEvent.create(kind=ToolEventKind.CALL, tool_name="echo").event_id != evt.event_id
@@ -60,3 +60,15 @@ async def test_handler_timeout(handler):
     assert event.kind == ToolEventKind.TIMEOUT
     assert event.error
     assert "timeout" in event.error.lower() or "timed out" in event.error.lower()
+
+
+@pytest.mark.asyncio
+async def test_handler_externalizes_large_results(handler):
+    payload = {"rows": ["x" * 64] * 32}
+    handler._bridge.execute = AsyncMock(return_value=payload)
+    event = await handler.call("dump", {})
+    assert event.result == str(payload)
+    kinds = [e.kind for e in handler._session.event_log.events]
+    assert kinds == ["tool_call", "artifact_stored", "tool_success"]
+    artifact_id = handler._session.event_log.events[1].data["handle"]
+    assert handler._artifact_store.retrieve(artifact_id) == str(payload).encode()
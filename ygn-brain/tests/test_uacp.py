@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
 from ygn_brain.uacp import UacpCodec, UacpMessage, UacpVerb
@@ -68,6 +70,20 @@ class TestEdgeCases:
         assert len(decoded.payload) == 1_000_000
         assert decoded.payload == payload
 
+    def test_decode_from_buffer_types(self) -> None:
+        msg = _make_test_message(UacpVerb.OBSERVE, b"obs")
+        frame = bytearray(UacpCodec.encode(msg))
+        for data in (frame, memoryview(frame), memoryview(frame)[0:]):
+            decoded = UacpCodec.decode(data)
+            assert decoded == msg
+            assert type(decoded.payload) is bytes
+        del data
+        batch = bytearray(UacpCodec.encode_batch([msg, msg]))
+        assert UacpCodec.decode_batch(memoryview(batch)) == [msg, msg]
+        # No view of the caller's buffer outlives the call.
+        frame.extend(b"\x00")
+        batch.clear()
+
 
 class TestBatch:
     """Batch encode/decode."""
@@ -114,6 +130,26 @@ class TestErrors:
         with pytest.raises(ValueError, match="invalid uACP verb byte"):
             UacpCodec.decode(bytes(data))
 
+    def test_batch_rejects_truncated_frames(self) -> None:
+        batch = UacpCodec.encode_batch([_make_test_message(UacpVerb.TELL, b"abcdef")] * 2)
+        with pytest.raises(ValueError, match="payload_len"):
+            UacpCodec.decode_batch(batch[:-1])
+        with pytest.raises(ValueError, match="trailing 3 bytes"):
+            UacpCodec.decode_batch(batch + b"\x01\x00\x00")
+
+    @pytest.mark.parametrize("decode", [UacpCodec.decode, UacpCodec.decode_batch])
+    def test_failed_decode_leaves_bytearray_resizable(self, decode) -> None:
+        frame = UacpCodec.encode(_make_test_message(UacpVerb.TELL, b"abcdef"))
+        buf = bytearray(frame[:-2])
+        with pytest.raises(ValueError, match="payload_len") as excinfo:
+            decode(buf)
+        # The traceback keeps the decoder's frame alive; the buffer must not
+        # stay exported through it.
+        assert excinfo.traceback
+        buf += frame[-2:]
+        assert UacpCodec.decode(buf).payload == b"abcdef"
+        buf.clear()
+
     def test_truncated_data(self) -> None:
         with pytest.raises(ValueError, match="too short"):
             UacpCodec.decode(b"\x01\x00")
@@ -160,6 +196,11 @@ class TestConstructors:
         assert msg.sender_id == "node-a"
         assert msg.payload == b""
 
+    def test_constructor_timestamp_is_wall_clock_millis(self) -> None:
+        before = time.time_ns() // 1_000_000
+        msg = UacpMessage.tell("node-t", b"")
+        assert before <= msg.timestamp <= time.time_ns() // 1_000_000
+
     def test_tell_constructor(self) -> None:
         msg = UacpMessage.tell("node-b", b"data")
         assert msg.verb == UacpVerb.TELL
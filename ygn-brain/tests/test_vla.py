@@ -100,3 +100,19 @@ async def test_vla_bridge_produces_mcp_compatible_calls() -> None:
         assert "action_type" in call["params"]
         assert "parameters" in call["params"]
         assert "confidence" in call["params"]
+
+
+@pytest.mark.asyncio
+async def test_stub_vla_matches_whole_words_only() -> None:
+    """Keywords embedded in other words ("task", "already", "good") do not fire."""
+    adapter = StubVLAAdapter()
+    output = await adapter.predict(
+        VLAInput(image_description="desk", instruction="The task is already good")
+    )
+    assert output.actions[0]["parameters"]["matched_keywords"] == []
+
+    output = await adapter.predict(
+        VLAInput(image_description="desk", instruction="Check, then read it aloud and say 'go'")
+    )
+    matched = {a["type"]: a["parameters"]["matched_keywords"] for a in output.actions}
+    assert matched == {"drive": ["go"], "speak": ["say"], "sense": ["check", "read"]}